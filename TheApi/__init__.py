@@ -1,3 +1,8 @@
+from ._cache import ResultCache, SearchCache
+from ._saavn_models import Album, Artist, Playlist, Song
+from ._saavn_store import SaavnStore
+from ._sessions import SessionPool
+from ._store import DownloadStore
 from .api import Client
 from .saavn import SaavnAPI
 from .wordle import Wordle
@@ -0,0 +1,118 @@
+import asyncio
+import hashlib
+import os
+from functools import lru_cache
+from urllib.parse import urlparse
+
+import aiofiles
+from PIL import Image, ImageFont
+
+from ._request import Request
+
+
+@lru_cache(maxsize=32)
+def _load_image(path: str) -> Image.Image:
+    img = Image.open(path)
+    img.load()
+    return img
+
+
+@lru_cache(maxsize=256)
+def load_font(path: str, size: int) -> ImageFont.FreeTypeFont:
+    """Returns a process-wide cached ``FreeTypeFont`` for ``(path, size)``."""
+    return ImageFont.truetype(path, size)
+
+
+def load_image(path: str) -> Image.Image:
+    """Returns a fresh copy of the decoded image at ``path``, decoding it only once per process."""
+    return _load_image(path).copy()
+
+
+class AssetManager:
+    """
+    Downloads remote assets (templates, fonts) once and keeps them on disk and in memory.
+
+    Files are stored in ``cache_dir`` and reused across processes; decoded images and
+    fonts are cached in memory for the lifetime of the process.
+
+    Args:
+        cache_dir (``str``, *optional*): Directory to persist downloaded assets.
+            Defaults to ``$XDG_CACHE_HOME/TheApi`` or ``~/.cache/TheApi``.
+    """
+
+    def __init__(self, cache_dir: str | None = None):
+        self.cache_dir = cache_dir or os.path.join(
+            os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")),
+            "TheApi",
+        )
+        self.request = Request()
+        self._paths: dict[str, str] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+
+    def _cache_path(self, url: str) -> str:
+        digest = hashlib.sha1(url.encode()).hexdigest()[:16]
+        name = os.path.basename(urlparse(url).path) or "asset"
+        return os.path.join(self.cache_dir, f"{digest}_{name}")
+
+    async def get_path(self, url: str) -> str:
+        """
+        Returns the local path of the asset at ``url``, downloading it on first use.
+
+        Args:
+            url (``str``): The asset URL.
+
+        Returns:
+            ``str``: Path to the cached file.
+        """
+        if url in self._paths:
+            return self._paths[url]
+
+        lock = self._locks.setdefault(url, asyncio.Lock())
+        async with lock:
+            if url in self._paths:
+                return self._paths[url]
+
+            path = self._cache_path(url)
+            if not os.path.isfile(path):
+                response = await self.request.get(url)
+                response.raise_for_status()
+
+                os.makedirs(self.cache_dir, exist_ok=True)
+                tmp_path = f"{path}.{os.getpid()}.tmp"
+                async with aiofiles.open(tmp_path, "wb") as f:
+                    await f.write(response.content)
+                os.replace(tmp_path, path)
+
+            self._paths[url] = path
+            return path
+
+    async def get_image(self, url: str) -> Image.Image:
+        """Returns a copy of the decoded image at ``url`` that is safe to draw on."""
+        return load_image(await self.get_path(url))
+
+    async def get_font(self, url: str, size: int) -> ImageFont.FreeTypeFont:
+        """Returns the font at ``url`` loaded at ``size`` points."""
+        return load_font(await self.get_path(url), size)
+
+    async def preload(
+        self,
+        images: list[str] | None = None,
+        fonts: dict[str, list[int]] | None = None,
+    ):
+        """
+        Downloads and decodes assets ahead of time, e.g. on application startup.
+
+        Args:
+            images (``list``, *optional*): Image URLs to download and decode.
+            fonts (``dict``, *optional*): Mapping of font URL to the sizes to load.
+        """
+        images, fonts = images or [], fonts or {}
+        paths = await asyncio.gather(*(self.get_path(url) for url in [*images, *fonts]))
+        for path in paths[: len(images)]:
+            _load_image(path)
+        for path, sizes in zip(paths[len(images) :], fonts.values()):
+            for size in sizes:
+                load_font(path, size)
+
+
+assets = AssetManager()
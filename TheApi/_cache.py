@@ -0,0 +1,366 @@
+import asyncio
+import hashlib
+import json
+import os
+import re
+import secrets
+import shutil
+import time
+from collections import OrderedDict
+from typing import Any
+
+import aiofiles
+
+# The names :meth:`ResultCache.key` gives entries; nothing else in ``cache_dir`` is touched.
+_KEY_NAME = re.compile(r"^\w+-[0-9a-f]{64}$")
+
+
+def _tmp_path(path: str) -> str:
+    # Unique per write, so concurrent writers of one key never share a temporary file.
+    return f"{path}.{os.getpid()}.{secrets.token_hex(4)}.tmp"
+
+
+class ResultCache:
+    """
+    A size-bounded LRU cache for files produced by :class:`Client` generators.
+
+    Entries are keyed by a canonical hash of the method name and its request payload and
+    stored on disk, with a small in-memory tier for hot entries. Each method has its own
+    time-to-live; ``None`` keeps entries until they are evicted and ``0`` disables caching
+    for that method. Only files named like cache keys are managed, so other files in
+    ``cache_dir`` are never evicted or cleared.
+
+    Args:
+        cache_dir (``str``, *optional*): Directory for cached files.
+            Defaults to ``$XDG_CACHE_HOME/TheApi/results`` or ``~/.cache/TheApi/results``.
+        max_size (``int``, *optional*): Maximum total size on disk in bytes. Defaults to 256 MiB.
+        max_memory_size (``int``, *optional*): Maximum total size kept in memory in bytes. Defaults to 16 MiB.
+        ttl (``dict``, *optional*): Per-method TTLs in seconds, merged over :attr:`DEFAULT_TTL`.
+
+    Example:
+        .. code-block:: python
+
+           from TheApi import Client, ResultCache
+
+           api = Client(result_cache=ResultCache(ttl={"take_screenshot": 60}))
+    """
+
+    DEFAULT_TTL = {
+        "carbon": None,
+        "gen_qr": None,
+        "generate_pdf": 300,
+        "take_screenshot": 300,
+    }
+
+    def __init__(
+        self,
+        cache_dir: str | None = None,
+        max_size: int = 256 * 1024 * 1024,
+        max_memory_size: int = 16 * 1024 * 1024,
+        ttl: dict[str, float | None] | None = None,
+    ):
+        self.cache_dir = cache_dir or os.path.join(
+            os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")),
+            "TheApi",
+            "results",
+        )
+        self.max_size = max_size
+        self.max_memory_size = max_memory_size
+        self.ttl = {**self.DEFAULT_TTL, **(ttl or {})}
+        self.hits = 0
+        self.misses = 0
+
+        self._index: OrderedDict[str, tuple[int, float]] = OrderedDict()
+        self._memory: OrderedDict[str, bytes] = OrderedDict()
+        self._size = 0
+        self._memory_size = 0
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._load_index()
+
+    def _load_index(self):
+        entries = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.is_file() and _KEY_NAME.match(entry.name):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, entry.name, stat.st_size))
+        for created, key, size in sorted(entries):
+            self._index[key] = (size, created)
+            self._size += size
+
+    @staticmethod
+    def key(method: str, payload: Any) -> str:
+        """Returns the cache key for ``method`` called with ``payload``."""
+        canonical = json.dumps(
+            payload, sort_keys=True, separators=(",", ":"), default=str
+        )
+        return f"{method}-{hashlib.sha256(canonical.encode()).hexdigest()}"
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key)
+
+    def _discard(self, key: str):
+        size, _ = self._index.pop(key)
+        self._size -= size
+        if key in self._memory:
+            self._memory_size -= len(self._memory.pop(key))
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def _remember(self, key: str, contents: bytes):
+        if len(contents) > self.max_memory_size // 4:
+            return
+        if key in self._memory:
+            self._memory_size -= len(self._memory.pop(key))
+        self._memory[key] = contents
+        self._memory_size += len(contents)
+        while self._memory_size > self.max_memory_size:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_size -= len(evicted)
+
+    async def get(self, method: str, payload: Any) -> bytes | None:
+        """
+        Returns the cached result of ``method`` for ``payload``, or ``None`` on a miss.
+        """
+        ttl = self.ttl.get(method)
+        if ttl == 0:
+            return None
+
+        key = self.key(method, payload)
+        entry = self._index.get(key)
+        if entry and ttl is not None and time.time() - entry[1] > ttl:
+            self._discard(key)
+            entry = None
+        if not entry:
+            self.misses += 1
+            return None
+
+        self._index.move_to_end(key)
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            self.hits += 1
+            return self._memory[key]
+
+        try:
+            async with aiofiles.open(self._path(key), "rb") as f:
+                contents = await f.read()
+        except FileNotFoundError:
+            self._discard(key)
+            self.misses += 1
+            return None
+
+        self._remember(key, contents)
+        self.hits += 1
+        return contents
+
+    async def set(self, method: str, payload: Any, contents: bytes):
+        """Stores ``contents`` as the result of ``method`` for ``payload``."""
+        if self.ttl.get(method) == 0 or len(contents) > self.max_size:
+            return
+
+        key = self.key(method, payload)
+        if key in self._index:
+            self._discard(key)
+
+        path = self._path(key)
+        tmp_path = _tmp_path(path)
+        try:
+            async with aiofiles.open(tmp_path, "wb") as f:
+                await f.write(contents)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+        self._add(key, len(contents))
+        self._remember(key, contents)
+
+    async def set_file(self, method: str, payload: Any, file_path: str):
+        """
+        Stores a copy of the file at ``file_path`` as the result of ``method`` for ``payload``.
+
+        Unlike :meth:`set`, the contents are copied on disk without being read into memory.
+        """
+        size = os.path.getsize(file_path)
+        if self.ttl.get(method) == 0 or size > self.max_size:
+            return
+
+        key = self.key(method, payload)
+        if key in self._index:
+            self._discard(key)
+
+        path = self._path(key)
+        tmp_path = _tmp_path(path)
+        try:
+            await asyncio.to_thread(shutil.copyfile, file_path, tmp_path)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        self._add(key, size)
+
+    def _add(self, key: str, size: int):
+        # A concurrent set of the same key may have indexed it while this one was writing;
+        # the last rename wins, so only its size is counted.
+        if key in self._index:
+            self._size -= self._index.pop(key)[0]
+        self._index[key] = (size, time.time())
+        self._size += size
+        while self._size > self.max_size:
+            self._discard(next(iter(self._index)))
+
+    def clear(self):
+        """Removes every cached entry."""
+        for key in list(self._index):
+            self._discard(key)
+
+    def stats(self) -> dict:
+        """
+        Returns cache statistics.
+
+        Returns:
+            ``dict``: ``entries``, ``size``, ``memory_size``, ``hits``, ``misses`` and ``hit_rate``.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._index),
+            "size": self._size,
+            "memory_size": self._memory_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+class SearchCache:
+    """
+    A TTL and LRU bounded cache for the results extracted by :class:`Client` scrapers.
+
+    Entries are keyed by the method name, the normalized query (case-folded, with runs of
+    whitespace collapsed) and the parameters that change the results, such as language,
+    region or safe-search level. The extracted results are stored rather than raw HTML,
+    so a hit costs neither a request nor a parse. Results are kept in memory and, when
+    ``cache_dir`` is given, also on disk through a :class:`ResultCache`, so they survive
+    restarts. Every lookup decodes a fresh copy, so callers may modify the results they get.
+    Paged methods keep the position they reached, which lets a call with a
+    larger ``limit`` reuse a cached shorter result and fetch only the missing tail.
+
+    Args:
+        max_entries (``int``, *optional*): Maximum number of entries kept in memory. Defaults to 1024.
+        ttl (``dict``, *optional*): Per-method TTLs in seconds, merged over :attr:`DEFAULT_TTL`.
+            ``None`` keeps entries until they are evicted and ``0`` disables caching for that method.
+        cache_dir (``str``, *optional*): Directory for the disk tier. Defaults to memory only.
+        max_disk_size (``int``, *optional*): Maximum size of the disk tier in bytes. Defaults to 64 MiB.
+
+    Example:
+        .. code-block:: python
+
+           from TheApi import Client, SearchCache
+
+           api = Client(search_cache=SearchCache(ttl={"google_search": 600}))
+    """
+
+    DEFAULT_TTL = {
+        "google_search": 3600,
+        "bing_image": 3600,
+        "hashtag": 86400,
+    }
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl: dict[str, float | None] | None = None,
+        cache_dir: str | None = None,
+        max_disk_size: int = 64 * 1024 * 1024,
+    ):
+        self.max_entries = max_entries
+        self.ttl = {**self.DEFAULT_TTL, **(ttl or {})}
+        self.hits = 0
+        self.misses = 0
+
+        self._memory: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._disk = (
+            ResultCache(
+                cache_dir, max_size=max_disk_size, max_memory_size=0, ttl=self.ttl
+            )
+            if cache_dir
+            else None
+        )
+
+    @staticmethod
+    def normalize_query(query: str) -> str:
+        """Returns ``query`` case-folded with surrounding and repeated whitespace removed."""
+        return " ".join(query.split()).casefold()
+
+    def _payload(self, query: str, params: dict) -> dict:
+        return {"query": self.normalize_query(query), **params}
+
+    async def get(self, method: str, query: str, params: dict) -> Any | None:
+        """
+        Returns the cached results of ``method`` for ``query`` and ``params``, or ``None`` on a miss.
+        """
+        ttl = self.ttl.get(method)
+        if ttl == 0:
+            return None
+
+        payload = self._payload(query, params)
+        key = ResultCache.key(method, payload)
+        entry = self._memory.get(key)
+        if entry and ttl is not None and time.time() - entry[0] > ttl:
+            del self._memory[key]
+            entry = None
+        if entry:
+            self._memory.move_to_end(key)
+            self.hits += 1
+            return json.loads(entry[1])
+
+        if self._disk is not None:
+            contents = await self._disk.get(method, payload)
+            if contents is not None:
+                self._store(key, contents, self._disk._index[key][1])
+                self.hits += 1
+                return json.loads(contents)
+
+        self.misses += 1
+        return None
+
+    def _store(self, key: str, contents: bytes, created: float):
+        self._memory[key] = (created, contents)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    async def set(self, method: str, query: str, params: dict, value: Any):
+        """Stores ``value`` as the results of ``method`` for ``query`` and ``params``."""
+        if self.ttl.get(method) == 0:
+            return
+
+        payload = self._payload(query, params)
+        contents = json.dumps(value).encode()
+        self._store(ResultCache.key(method, payload), contents, time.time())
+        if self._disk is not None:
+            await self._disk.set(method, payload, contents)
+
+    def clear(self):
+        """Removes every cached entry, including the disk tier."""
+        self._memory.clear()
+        if self._disk is not None:
+            self._disk.clear()
+
+    def stats(self) -> dict:
+        """
+        Returns cache statistics.
+
+        Returns:
+            ``dict``: ``entries`` (in memory), ``disk_entries``, ``hits``, ``misses`` and ``hit_rate``.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._memory),
+            "disk_entries": self._disk.stats()["entries"] if self._disk else 0,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
@@ -0,0 +1,244 @@
+import re
+from base64 import b64decode
+from io import BytesIO
+
+from PIL import Image, ImageChops, ImageColor, ImageDraw, ImageFilter, ImageFont
+
+from ._assets import load_font
+
+try:
+    from pygments.lexers import (
+        TextLexer,
+        get_lexer_by_name,
+        get_lexer_for_mimetype,
+        guess_lexer,
+    )
+    from pygments.styles import get_style_by_name
+    from pygments.util import ClassNotFound
+except ImportError:
+    get_style_by_name = None
+
+CODE_FONT = "/usr/share/fonts/truetype/dejavu/DejaVuSansMono.ttf"
+CODE_FONT_BOLD = "/usr/share/fonts/truetype/dejavu/DejaVuSansMono-Bold.ttf"
+
+# Closest Pygments style for each Carbon theme.
+THEMES = {
+    "3024-night": "native",
+    "a11y-dark": "github-dark",
+    "blackboard": "monokai",
+    "base16-dark": "native",
+    "base16-light": "default",
+    "cobalt": "monokai",
+    "duotone-dark": "paraiso-dark",
+    "dracula-pro": "dracula",
+    "hopscotch": "paraiso-dark",
+    "lucario": "monokai",
+    "material": "material",
+    "monokai": "monokai",
+    "nightowl": "one-dark",
+    "nord": "nord",
+    "oceanic-next": "one-dark",
+    "one-light": "default",
+    "one-dark": "one-dark",
+    "panda-syntax": "dracula",
+    "parasio-dark": "paraiso-dark",
+    "seti": "monokai",
+    "shades-of-purple": "dracula",
+    "solarized+dark": "solarized-dark",
+    "solarized+light": "solarized-light",
+    "synthwave-84": "fruity",
+    "twilight": "monokai",
+    "verminal": "native",
+    "vscode": "github-dark",
+    "yeti": "default",
+    "zenburn": "zenburn",
+}
+
+WINDOW_CONTROLS = ("#ff5f56", "#ffbd2e", "#27c93f")
+
+_RGBA = re.compile(
+    r"rgba?\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*(?:,\s*([\d.]+)\s*)?\)", re.I
+)
+
+
+def _px(value: str | int) -> float:
+    return float(str(value).strip().removesuffix("px"))
+
+
+def _color(value: str) -> tuple[int, int, int, int]:
+    match = _RGBA.fullmatch(value.strip())
+    if match:
+        r, g, b, a = match.groups()
+        return int(r), int(g), int(b), round(float(a or 1) * 255)
+    return ImageColor.getcolor(value, "RGBA")
+
+
+def _lexer(code: str, language: str):
+    try:
+        if language == "auto":
+            return guess_lexer(code)
+        if "/" in language:
+            return get_lexer_for_mimetype(language)
+        return get_lexer_by_name(language)
+    except ClassNotFound:
+        return TextLexer()
+
+
+def _style(theme: str):
+    try:
+        return get_style_by_name(THEMES.get(theme, theme))
+    except ClassNotFound:
+        return get_style_by_name("monokai")
+
+
+def _fonts(font_custom: str, size: int):
+    if font_custom:
+        font = ImageFont.truetype(BytesIO(b64decode(font_custom)), size)
+        return font, font
+    try:
+        regular = load_font(CODE_FONT, size)
+    except OSError:
+        regular = ImageFont.load_default(size)
+    try:
+        bold = load_font(CODE_FONT_BOLD, size)
+    except OSError:
+        bold = regular
+    return regular, bold
+
+
+def _tokenize(code: str, lexer, style, default: str) -> list[list[tuple]]:
+    lines = [[]]
+    for token, value in lexer.get_tokens(code):
+        spec = style.style_for_token(token)
+        color = f"#{spec['color']}" if spec["color"] else default
+        parts = value.split("\n")
+        for i, part in enumerate(parts):
+            if i:
+                lines.append([])
+            if part:
+                lines[-1].append((part.expandtabs(2), color, spec["bold"]))
+    if lines and not lines[-1]:
+        lines.pop()
+    return lines
+
+
+def _selected(selected_lines: str, first: int, count: int) -> set[int]:
+    selected = set()
+    for part in filter(None, (p.strip() for p in selected_lines.split(","))):
+        start, _, end = part.partition("-")
+        selected.update(range(int(start), int(end or start) + 1))
+    return {n - first for n in selected if 0 <= n - first < count}
+
+
+def render_code(code: str, options: dict) -> bytes:
+    """
+    Renders ``code`` to a PNG resembling a `Carbon <https://carbon.now.sh>`_ snippet.
+
+    ``options`` uses the same camelCase keys as the Carbonara payload built by
+    :meth:`Client.carbon`. Requires Pygments for tokenization.
+    """
+    if get_style_by_name is None:
+        raise ImportError(
+            "The local carbon backend requires Pygments: pip install TheApix[carbon]"
+        )
+
+    scale = int(str(options.get("exportSize", "2x")).rstrip("x") or 1)
+    font_size = round(_px(options.get("fontSize", "14px")) * scale)
+    line_height = round(
+        font_size * float(str(options.get("lineHeight", "133%")).rstrip("%")) / 100
+    )
+    pad_x = round(_px(options.get("paddingHorizontal", "56px")) * scale)
+    pad_y = round(_px(options.get("paddingVertical", "56px")) * scale)
+    inner_x, inner_y = 16 * scale, 18 * scale
+    header = 36 * scale if options.get("windowControls", True) else 0
+    radius = 5 * scale
+
+    style = _style(options.get("theme", "seti"))
+    window_bg = _color(style.background_color or "#272822")
+    default_fg = "#f8f8f2" if sum(window_bg[:3]) < 384 else "#24292e"
+    lines = _tokenize(
+        code, _lexer(code, options.get("language", "auto")), style, default_fg
+    )
+    regular, bold = _fonts(options.get("fontCustom", ""), font_size)
+
+    first = int(options.get("firstLineNumber", 1))
+    gutter = 0
+    if options.get("lineNumbers"):
+        digits = len(str(first + max(len(lines), 1) - 1))
+        gutter = round(regular.getlength("0" * digits) + 2 * font_size)
+
+    content_width = max(
+        (
+            sum((bold if b else regular).getlength(text) for text, _, b in line)
+            for line in lines
+        ),
+        default=0,
+    )
+    if options.get("widthAdjustment", True):
+        window_w = round(content_width) + gutter + 2 * inner_x
+    else:
+        window_w = round(_px(options.get("width", 536)) * scale)
+    window_h = header + 2 * inner_y + max(len(lines), 1) * line_height
+
+    img_w, img_h = window_w + 2 * pad_x, window_h + 2 * pad_y
+    image = Image.new("RGBA", (img_w, img_h), _color(options["backgroundColor"]))
+    box = (pad_x, pad_y, pad_x + window_w, pad_y + window_h)
+
+    if options.get("dropShadow", True):
+        blur = _px(options.get("dropShadowBlurRadius", "68px")) * scale
+        offset = round(_px(options.get("dropShadowOffsetY", "20px")) * scale)
+        shadow = Image.new("RGBA", (img_w, img_h), (0, 0, 0, 0))
+        ImageDraw.Draw(shadow).rounded_rectangle(
+            (box[0], box[1] + offset, box[2], box[3] + offset),
+            radius=radius,
+            fill=(0, 0, 0, 140),
+        )
+        image.alpha_composite(shadow.filter(ImageFilter.GaussianBlur(blur / 2)))
+
+    draw = ImageDraw.Draw(image)
+    draw.rounded_rectangle(box, radius=radius, fill=window_bg)
+
+    if header:
+        cy, r = pad_y + header // 2 + 4 * scale, 6 * scale
+        for i, fill in enumerate(WINDOW_CONTROLS):
+            cx = pad_x + inner_x + r + i * 20 * scale
+            circle = (cx - r, cy - r, cx + r, cy + r)
+            if options.get("windowTheme") == "bw":
+                draw.ellipse(circle, outline=default_fg, width=scale)
+            elif options.get("windowTheme") in ("sharp", "boxy"):
+                draw.rectangle(circle, fill=fill)
+            else:
+                draw.ellipse(circle, fill=fill)
+
+    selected = _selected(options.get("selectedLines", ""), first, len(lines))
+    number_color = (*_color(default_fg)[:3], 110)
+    text_layer = Image.new("RGBA", (img_w, img_h), (0, 0, 0, 0))
+    text_draw = ImageDraw.Draw(text_layer)
+    y = pad_y + header + inner_y
+    for index, line in enumerate(lines):
+        alpha = 255 if not selected or index in selected else 110
+        if gutter:
+            text_draw.text(
+                (pad_x + inner_x, y),
+                str(first + index),
+                fill=number_color,
+                font=regular,
+            )
+        x = pad_x + inner_x + gutter
+        for text, color, is_bold in line:
+            font = bold if is_bold else regular
+            text_draw.text((x, y), text, fill=(*_color(color)[:3], alpha), font=font)
+            x += font.getlength(text)
+        y += line_height
+
+    # Clip code that overflows a fixed-width window.
+    mask = Image.new("L", (img_w, img_h), 0)
+    ImageDraw.Draw(mask).rectangle(
+        (box[0], box[1], box[2] - inner_x // 2, box[3]), fill=255
+    )
+    text_layer.putalpha(ImageChops.multiply(text_layer.getchannel("A"), mask))
+    image.alpha_composite(text_layer)
+
+    out = BytesIO()
+    image.save(out, format="PNG")
+    return out.getvalue()
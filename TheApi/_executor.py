@@ -0,0 +1,82 @@
+import asyncio
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any
+
+
+class Offloader:
+    """
+    Runs blocking, CPU-bound callables away from the event loop.
+
+    Each method name is mapped to a mode:
+
+        - ``"thread"``: run in a shared thread pool (default).
+        - ``"process"``: run in a shared process pool. The callable and its
+          arguments must be picklable.
+        - ``"inline"``: run directly on the event loop.
+
+    Args:
+        modes (``dict``, *optional*): Mapping of method name to mode.
+        default (``str``, *optional*): Mode for methods not listed in ``modes``. Defaults to ``"thread"``.
+        max_workers (``int``, *optional*): Worker count for the pools. Defaults to the executor defaults.
+    """
+
+    MODES = ("inline", "thread", "process")
+
+    def __init__(
+        self,
+        modes: dict[str, str] | None = None,
+        default: str = "thread",
+        max_workers: int | None = None,
+    ):
+        self.modes = {}
+        self.default = self._check(default)
+        self.max_workers = max_workers
+        self._executors: dict[str, Executor] = {}
+        for method, mode in (modes or {}).items():
+            self.set_mode(method, mode)
+
+    def _check(self, mode: str) -> str:
+        if mode not in self.MODES:
+            raise ValueError(
+                f"Invalid offload mode '{mode}'. Must be one of {', '.join(self.MODES)}"
+            )
+        return mode
+
+    def set_mode(self, method: str, mode: str):
+        """Sets the offload mode used by ``method``."""
+        self.modes[method] = self._check(mode)
+
+    def mode(self, method: str) -> str:
+        """Returns the offload mode used by ``method``."""
+        return self.modes.get(method, self.default)
+
+    def _executor(self, mode: str) -> Executor:
+        if mode not in self._executors:
+            pool = ThreadPoolExecutor if mode == "thread" else ProcessPoolExecutor
+            self._executors[mode] = pool(max_workers=self.max_workers)
+        return self._executors[mode]
+
+    async def run(self, method: str, func: Callable, *args: Any) -> Any:
+        """
+        Runs ``func(*args)`` according to the mode configured for ``method``.
+
+        Args:
+            method (``str``): The public method name the work belongs to, e.g. ``"blackpink"``.
+            func (``Callable``): The blocking callable.
+            *args: Positional arguments for ``func``.
+
+        Returns:
+            The return value of ``func``.
+        """
+        mode = self.mode(method)
+        if mode == "inline":
+            return func(*args)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor(mode), func, *args)
+
+    def shutdown(self, wait: bool = True):
+        """Shuts down any pools created so far."""
+        for executor in self._executors.values():
+            executor.shutdown(wait=wait)
+        self._executors.clear()
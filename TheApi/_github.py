@@ -0,0 +1,171 @@
+from typing import NamedTuple
+
+from httpx import URL
+
+SEARCH_TYPES = (
+    "repositories",
+    "users",
+    "organizations",
+    "issues",
+    "pull_requests",
+    "commits",
+    "topics",
+)
+
+# GitHub caps ``per_page`` for the search API at 100.
+MAX_PER_PAGE = 100
+
+
+class Repository(NamedTuple):
+    name: str
+    full_name: str
+    description: str | None
+    url: str
+    language: str | None
+    stargazers_count: int | None
+    forks_count: int | None
+
+
+class Account(NamedTuple):
+    login: str
+    id: int
+    url: str
+    avatar_url: str | None
+    type: str | None
+    site_admin: bool | None
+    name: str | None
+    company: str | None
+    blog: str | None
+    location: str | None
+    email: str | None
+    bio: str | None
+    public_repos: int | None
+    public_gists: int | None
+    followers: int | None
+    following: int | None
+
+
+class Issue(NamedTuple):
+    title: str
+    user: str
+    state: str
+    url: str
+    comments: int | None
+    created_at: str | None
+    updated_at: str | None
+    closed_at: str | None
+
+
+class Commit(NamedTuple):
+    sha: str
+    commit_message: str
+    author: str
+    date: str
+    url: str
+
+
+class Topic(NamedTuple):
+    name: str
+    display_name: str | None
+    short_description: str | None
+    description: str | None
+    created_by: str | None
+    url: str | None
+
+
+def _repository(item: dict) -> Repository:
+    return Repository(
+        item["name"],
+        item["full_name"],
+        item["description"],
+        item["html_url"],
+        item.get("language"),
+        item.get("stargazers_count"),
+        item.get("forks_count"),
+    )
+
+
+def _account(item: dict) -> Account:
+    return Account(
+        item["login"],
+        item["id"],
+        item["html_url"],
+        *(item.get(field) for field in Account._fields[3:]),
+    )
+
+
+def _issue(item: dict) -> Issue:
+    return Issue(
+        item["title"],
+        item["user"]["login"],
+        item["state"],
+        item["html_url"],
+        item.get("comments"),
+        item.get("created_at"),
+        item.get("updated_at"),
+        item.get("closed_at"),
+    )
+
+
+def _commit(item: dict) -> Commit:
+    return Commit(
+        item["sha"],
+        item["commit"]["message"],
+        item["commit"]["author"]["name"],
+        item["commit"]["author"]["date"],
+        item["html_url"],
+    )
+
+
+def _topic(item: dict) -> Topic:
+    return Topic(
+        item["name"],
+        item.get("display_name"),
+        item.get("short_description"),
+        item.get("description"),
+        item.get("created_by"),
+        item.get("url"),
+    )
+
+
+PROJECTIONS = {
+    "repositories": _repository,
+    "users": _account,
+    "organizations": _account,
+    "issues": _issue,
+    "pull_requests": _issue,
+    "commits": _commit,
+    "topics": _topic,
+}
+
+
+def search_endpoint(search_type: str, query: str) -> tuple[str, str]:
+    """Returns the search API URL and the query to send for ``search_type``."""
+    if search_type == "pull_requests":
+        return "https://api.github.com/search/issues", query + " type:pr"
+    if search_type == "organizations":
+        return "https://api.github.com/search/users", query + " type:org"
+    return f"https://api.github.com/search/{search_type}", query
+
+
+def page_urls(links: dict, pages: int) -> list[str] | None:
+    """
+    Expands the ``next`` and ``last`` links of a page into the URLs of the following pages,
+    up to page ``pages``.
+
+    Returns ``None`` when the links carry no page number, in which case ``next`` has to be
+    followed one page at a time.
+    """
+    if "next" not in links:
+        return []
+    next_url = URL(links["next"]["url"])
+    if "page" not in next_url.params:
+        return None
+    first = int(next_url.params["page"])
+    last = first
+    if "last" in links:
+        last = int(URL(links["last"]["url"]).params.get("page", first))
+    return [
+        str(next_url.copy_set_param("page", page))
+        for page in range(first, min(last, pages) + 1)
+    ]
@@ -0,0 +1,124 @@
+import re
+from importlib.util import find_spec
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+BING_IMAGE_START = "murl&quot;:&quot;"
+BING_IMAGE_PATTERN = re.compile(re.escape(BING_IMAGE_START) + r"(.*?)&quot;")
+
+# Fastest first; html.parser ships with Python and is always available.
+PARSERS = ("selectolax", "lxml", "html.parser")
+
+# Matches the "g" class token while the page is tokenized, before class is split.
+_GOOGLE_STRAINER = SoupStrainer("div", class_=re.compile(r"(?:^|\s)g(?:\s|$)"))
+_HASHTAG_STRAINERS = {
+    True: SoupStrainer(id="hashtagy"),
+    False: SoupStrainer("p1"),
+}
+
+
+def available_parsers() -> list[str]:
+    """Returns the installed HTML parser backends, fastest first."""
+    return [
+        name for name in PARSERS if name == "html.parser" or find_spec(name) is not None
+    ]
+
+
+def resolve_parser(parser: str | None = None) -> str:
+    """
+    Returns ``parser``, or the fastest installed backend when it is ``None``.
+
+    Raises:
+        ValueError: If ``parser`` is not a known backend.
+        ImportError: If ``parser`` is not installed.
+    """
+    if parser is None:
+        return available_parsers()[0]
+    if parser not in PARSERS:
+        raise ValueError(
+            f"Invalid parser '{parser}'. Must be one of {', '.join(PARSERS)}"
+        )
+    if parser not in available_parsers():
+        raise ImportError(
+            f"The '{parser}' parser is not installed: pip install TheApix[fast]"
+        )
+    return parser
+
+
+def _google_result(link, title, description) -> dict | None:
+    if link is None or title is None or description is None:
+        return None
+    return {"url": link, "title": title, "desc": description}
+
+
+def parse_google_results(
+    html: str, parser: str | None = None
+) -> tuple[list[dict], bool]:
+    """
+    Extracts organic results from a Google search results page.
+
+    Only the ``div.g`` result blocks are built into a tree; the rest of the page is
+    skipped by the tokenizer.
+
+    Args:
+        html (``str``): The results page.
+        parser (``str``, *optional*): One of :data:`PARSERS`. Defaults to the fastest installed.
+
+    Returns:
+        ``tuple``: The results as ``{"url", "title", "desc"}`` dicts in page order, and
+        whether the page contained any result blocks at all.
+    """
+    parser = resolve_parser(parser)
+    results = []
+
+    if parser == "selectolax":
+        from selectolax.lexbor import LexborHTMLParser
+
+        blocks = LexborHTMLParser(html).css("div.g")
+        for block in blocks:
+            link = block.css_first("a[href]")
+            title = block.css_first("h3")
+            description = block.css_first('div[style="-webkit-line-clamp:2"]')
+            result = _google_result(
+                link and link.attributes["href"],
+                title and title.text(),
+                description and description.text(),
+            )
+            if result:
+                results.append(result)
+        return results, bool(blocks)
+
+    soup = BeautifulSoup(html, parser, parse_only=_GOOGLE_STRAINER)
+    blocks = soup.find_all("div", class_="g")
+    for block in blocks:
+        link = block.find("a", href=True)
+        title = block.find("h3")
+        description = block.find("div", {"style": "-webkit-line-clamp:2"})
+        result = _google_result(
+            link and link["href"],
+            title and title.text,
+            description and description.text,
+        )
+        if result:
+            results.append(result)
+    return results, bool(blocks)
+
+
+def parse_hashtags(
+    content: bytes, country: bool, parser: str | None = None
+) -> list[str] | str:
+    """Extracts hashtags from a tagsfinder.com (``country``) or best-hashtags.com page."""
+    parser = resolve_parser(parser)
+    if parser == "selectolax":
+        from selectolax.lexbor import LexborHTMLParser
+
+        node = LexborHTMLParser(content).css_first("#hashtagy" if country else "p1")
+        hashtags = node.text()
+    else:
+        soup = BeautifulSoup(
+            content, parser, parse_only=_HASHTAG_STRAINERS[bool(country)]
+        )
+        hashtags = (soup.find(id="hashtagy") if country else soup.find("p1")).get_text()
+    if hashtags:
+        hashtags = hashtags.strip().split(" ")
+    return hashtags
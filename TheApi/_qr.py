@@ -0,0 +1,483 @@
+from functools import lru_cache
+from io import BytesIO
+from operator import itemgetter
+from typing import Callable, NamedTuple
+
+from PIL import Image
+
+# Error correction levels: (index into the tables below, format bits).
+ERROR_CORRECTION = {"L": (0, 1), "M": (1, 0), "Q": (2, 3), "H": (3, 2)}
+
+# fmt: off
+ECC_CODEWORDS_PER_BLOCK = (
+    (-1, 7, 10, 15, 20, 26, 18, 20, 24, 30, 18, 20, 24, 26, 30, 22, 24, 28, 30, 28, 28, 28, 28, 30, 30, 26, 28, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30),
+    (-1, 10, 16, 26, 18, 24, 16, 18, 22, 22, 26, 30, 22, 22, 24, 24, 28, 28, 26, 26, 26, 26, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28),
+    (-1, 13, 22, 18, 26, 18, 24, 18, 22, 20, 24, 28, 26, 24, 20, 30, 24, 28, 28, 26, 30, 28, 30, 30, 30, 30, 28, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30),
+    (-1, 17, 28, 22, 16, 22, 28, 26, 26, 24, 28, 24, 28, 22, 24, 24, 30, 28, 28, 26, 28, 30, 24, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30),
+)
+
+NUM_ERROR_CORRECTION_BLOCKS = (
+    (-1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 4, 4, 4, 4, 4, 6, 6, 6, 6, 7, 8, 8, 9, 9, 10, 12, 12, 12, 13, 14, 15, 16, 17, 18, 19, 19, 20, 21, 22, 24, 25),
+    (-1, 1, 1, 1, 2, 2, 4, 4, 4, 5, 5, 5, 8, 9, 9, 10, 10, 11, 13, 14, 16, 17, 17, 18, 20, 21, 23, 25, 26, 28, 29, 31, 33, 35, 37, 38, 40, 43, 45, 47, 49),
+    (-1, 1, 1, 2, 2, 4, 4, 6, 6, 8, 8, 8, 10, 12, 16, 12, 17, 16, 18, 21, 20, 23, 23, 25, 27, 29, 34, 34, 35, 38, 40, 43, 45, 48, 51, 53, 56, 59, 62, 65, 68),
+    (-1, 1, 1, 2, 4, 4, 4, 5, 6, 8, 8, 11, 11, 16, 16, 18, 16, 19, 21, 25, 25, 25, 34, 30, 32, 35, 37, 40, 42, 45, 48, 51, 54, 57, 60, 63, 66, 70, 74, 77, 81),
+)
+# fmt: on
+
+ALPHANUMERIC_CHARSET = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ $%*+-./:"
+
+# Mode: (mode indicator, character count bits for versions 1-9, 10-26, 27-40).
+_MODES = {
+    "numeric": (0x1, (10, 12, 14)),
+    "alphanumeric": (0x2, (9, 11, 13)),
+    "byte": (0x4, (8, 16, 16)),
+}
+
+_MASKS = (
+    lambda x, y: (x + y) % 2 == 0,
+    lambda x, y: y % 2 == 0,
+    lambda x, y: x % 3 == 0,
+    lambda x, y: (x + y) % 3 == 0,
+    lambda x, y: (x // 3 + y // 2) % 2 == 0,
+    lambda x, y: x * y % 2 + x * y % 3 == 0,
+    lambda x, y: (x * y % 2 + x * y % 3) % 2 == 0,
+    lambda x, y: ((x + y) % 2 + x * y % 3) % 2 == 0,
+)
+
+# GF(256) exp/log tables for the 0x11D polynomial.
+_EXP = [0] * 512
+_LOG = [0] * 256
+_value = 1
+for _i in range(255):
+    _EXP[_i] = _value
+    _LOG[_value] = _i
+    _value <<= 1
+    if _value & 0x100:
+        _value ^= 0x11D
+for _i in range(255, 512):
+    _EXP[_i] = _EXP[_i - 255]
+
+
+def _gf_mul(x: int, y: int) -> int:
+    if x == 0 or y == 0:
+        return 0
+    return _EXP[_LOG[x] + _LOG[y]]
+
+
+@lru_cache(maxsize=None)
+def _rs_divisor(degree: int) -> tuple[int, ...]:
+    result = [0] * (degree - 1) + [1]
+    root = 1
+    for _ in range(degree):
+        for j in range(degree):
+            result[j] = _gf_mul(result[j], root)
+            if j + 1 < degree:
+                result[j] ^= result[j + 1]
+        root = _gf_mul(root, 0x02)
+    return tuple(result)
+
+
+@lru_cache(maxsize=None)
+def _rs_products(degree: int) -> tuple[int, ...]:
+    """The divisor multiplied by every byte value, packed as ``degree``-byte integers."""
+    divisor = _rs_divisor(degree)
+    return tuple(
+        int.from_bytes(bytes(_gf_mul(factor, coef) for coef in divisor), "big")
+        for factor in range(256)
+    )
+
+
+def _rs_remainder(data: list[int], degree: int) -> list[int]:
+    products = _rs_products(degree)
+    shift, mask = 8 * (degree - 1), (1 << 8 * degree) - 1
+    result = 0
+    for b in data:
+        result = (result << 8 & mask) ^ products[b ^ result >> shift]
+    return list(result.to_bytes(degree, "big"))
+
+
+def _raw_data_modules(version: int) -> int:
+    result = (16 * version + 128) * version + 64
+    if version >= 2:
+        num_align = version // 7 + 2
+        result -= (25 * num_align - 10) * num_align - 55
+        if version >= 7:
+            result -= 36
+    return result
+
+
+def _data_codewords(version: int, ecl: int) -> int:
+    return (
+        _raw_data_modules(version) // 8
+        - ECC_CODEWORDS_PER_BLOCK[ecl][version]
+        * NUM_ERROR_CORRECTION_BLOCKS[ecl][version]
+    )
+
+
+def _alignment_positions(version: int) -> list[int]:
+    if version == 1:
+        return []
+    num_align = version // 7 + 2
+    step = (version * 8 + num_align * 3 + 5) // (num_align * 4 - 4) * 2
+    result = [version * 4 + 10 - i * step for i in range(num_align - 1)]
+    return [6] + result[::-1]
+
+
+def _segment(data: str) -> tuple[str, int, list[tuple[int, int]]]:
+    """Returns the mode, character count and (value, bit length) chunks for ``data``."""
+    if data.isdigit() and data.isascii():
+        chunks = [
+            (int(data[i : i + 3]), len(data[i : i + 3]) * 3 + 1)
+            for i in range(0, len(data), 3)
+        ]
+        return "numeric", len(data), chunks
+    if all(c in ALPHANUMERIC_CHARSET for c in data):
+        chunks = []
+        for i in range(0, len(data) - 1, 2):
+            value = ALPHANUMERIC_CHARSET.index(data[i]) * 45
+            chunks.append((value + ALPHANUMERIC_CHARSET.index(data[i + 1]), 11))
+        if len(data) % 2:
+            chunks.append((ALPHANUMERIC_CHARSET.index(data[-1]), 6))
+        return "alphanumeric", len(data), chunks
+    raw = data.encode("utf-8")
+    return "byte", len(raw), [(b, 8) for b in raw]
+
+
+def _codewords(data: str, ecl: int) -> tuple[int, list[int]]:
+    mode, count, chunks = _segment(data)
+    indicator, count_bits = _MODES[mode]
+    payload_bits = sum(length for _, length in chunks)
+
+    for version in range(1, 41):
+        cc_bits = count_bits[0 if version < 10 else 1 if version < 27 else 2]
+        used = 4 + cc_bits + payload_bits
+        capacity = _data_codewords(version, ecl) * 8
+        if count < (1 << cc_bits) and used <= capacity:
+            break
+    else:
+        raise ValueError("Data too long to fit in a QR code")
+
+    bits, length = indicator, 4
+    for value, size in [(count, cc_bits), *chunks]:
+        bits = (bits << size) | value
+        length += size
+    terminator = min(4, capacity - length)
+    bits <<= terminator
+    length += terminator
+    bits <<= -length % 8
+    length += -length % 8
+
+    data_words = list(bits.to_bytes(length // 8, "big"))
+    pad = 0xEC
+    while len(data_words) < capacity // 8:
+        data_words.append(pad)
+        pad ^= 0xEC ^ 0x11
+    return version, data_words
+
+
+def _interleave(version: int, ecl: int, data: list[int]) -> list[int]:
+    num_blocks = NUM_ERROR_CORRECTION_BLOCKS[ecl][version]
+    block_ecc_len = ECC_CODEWORDS_PER_BLOCK[ecl][version]
+    raw_codewords = _raw_data_modules(version) // 8
+    num_short_blocks = num_blocks - raw_codewords % num_blocks
+    short_block_len = raw_codewords // num_blocks
+
+    blocks, k = [], 0
+    for i in range(num_blocks):
+        length = short_block_len - block_ecc_len + (0 if i < num_short_blocks else 1)
+        block = data[k : k + length]
+        k += length
+        ecc = _rs_remainder(block, block_ecc_len)
+        if i < num_short_blocks:
+            block.append(0)
+        blocks.append(block + ecc)
+
+    result = []
+    for i in range(len(blocks[0])):
+        for j, block in enumerate(blocks):
+            if i != short_block_len - block_ecc_len or j >= num_short_blocks:
+                result.append(block[i])
+    return result
+
+
+def _format_modules(size: int, ecl_bits: int, mask: int) -> list[tuple[int, int, bool]]:
+    """Returns the ``(x, y, dark)`` format information modules, including the dark module."""
+    data = ecl_bits << 3 | mask
+    rem = data
+    for _ in range(10):
+        rem = (rem << 1) ^ ((rem >> 9) * 0x537)
+    bits = (data << 10 | rem) ^ 0x5412
+    bit = [(bits >> i) & 1 != 0 for i in range(15)]
+
+    modules = [(8, i, bit[i]) for i in range(6)]
+    modules += [(8, 7, bit[6]), (8, 8, bit[7]), (7, 8, bit[8])]
+    modules += [(14 - i, 8, bit[i]) for i in range(9, 15)]
+    modules += [(size - 1 - i, 8, bit[i]) for i in range(8)]
+    modules += [(8, size - 15 + i, bit[i]) for i in range(8, 15)]
+    modules.append((8, size - 8, True))
+    return modules
+
+
+class _Matrix:
+    def __init__(self, version: int):
+        self.version = version
+        self.size = version * 4 + 17
+        self.modules = [[False] * self.size for _ in range(self.size)]
+        self.function = [[False] * self.size for _ in range(self.size)]
+
+    def set_function(self, x: int, y: int, dark: bool):
+        self.modules[y][x] = dark
+        self.function[y][x] = True
+
+    def draw_function_patterns(self):
+        size = self.size
+        for i in range(size):
+            self.set_function(6, i, i % 2 == 0)
+            self.set_function(i, 6, i % 2 == 0)
+
+        for cx, cy in ((3, 3), (size - 4, 3), (3, size - 4)):
+            for dy in range(-4, 5):
+                for dx in range(-4, 5):
+                    x, y = cx + dx, cy + dy
+                    if 0 <= x < size and 0 <= y < size:
+                        dist = max(abs(dx), abs(dy))
+                        self.set_function(x, y, dist not in (2, 4))
+
+        positions = _alignment_positions(self.version)
+        last = len(positions) - 1
+        for i, cx in enumerate(positions):
+            for j, cy in enumerate(positions):
+                if (i, j) in ((0, 0), (0, last), (last, 0)):
+                    continue
+                for dy in range(-2, 3):
+                    for dx in range(-2, 3):
+                        self.set_function(cx + dx, cy + dy, max(abs(dx), abs(dy)) != 1)
+
+        self.draw_format_bits(0, 0)
+        self.draw_version()
+
+    def draw_format_bits(self, ecl_bits: int, mask: int):
+        for x, y, dark in _format_modules(self.size, ecl_bits, mask):
+            self.set_function(x, y, dark)
+
+    def draw_version(self):
+        if self.version < 7:
+            return
+        rem = self.version
+        for _ in range(12):
+            rem = (rem << 1) ^ ((rem >> 11) * 0x1F25)
+        bits = self.version << 12 | rem
+        for i in range(18):
+            dark = (bits >> i) & 1 != 0
+            a, b = self.size - 11 + i % 3, i // 3
+            self.set_function(a, b, dark)
+            self.set_function(b, a, dark)
+
+
+class _Layout(NamedTuple):
+    """
+    The per-version parts of a symbol. Symbols are handled as bit strings packed one line
+    per ``size + 1`` characters, as rows (``y * stride + x``) and as columns
+    (``x * stride + y``). The extra character per line is always ``"0"`` and keeps runs
+    from wrapping onto the next line.
+    """
+
+    size: int
+    stride: int
+    # Gather the packed rows and columns from the data bits followed by ``b"01"``; function
+    # patterns read the trailing light or dark bit. Format information is left light.
+    rows: Callable[[bytes], tuple[int, ...]]
+    cols: Callable[[bytes], tuple[int, ...]]
+    # Per mask, the data modules it flips as packed (rows, cols) integers.
+    masks: tuple[tuple[int, int], ...]
+    # The modules of the symbol, without the separators.
+    valid: int
+
+
+@lru_cache(maxsize=None)
+def _layout(version: int) -> _Layout:
+    matrix = _Matrix(version)
+    matrix.draw_function_patterns()
+    size = matrix.size
+    stride = size + 1
+    for x, y, _ in _format_modules(size, 0, 0):
+        matrix.modules[y][x] = False
+
+    data_bits = _raw_data_modules(version) // 8 * 8
+    light, dark = data_bits, data_bits + 1
+    rows, cols = [light] * size * stride, [light] * size * stride
+    for y in range(size):
+        for x in range(size):
+            if matrix.modules[y][x]:
+                rows[y * stride + x] = cols[x * stride + y] = dark
+
+    data = []
+    right = size - 1
+    while right >= 1:
+        if right == 6:
+            right = 5
+        upward = (right + 1) & 2 == 0
+        for vert in range(size):
+            y = size - 1 - vert if upward else vert
+            for x in (right, right - 1):
+                if not matrix.function[y][x]:
+                    data.append((x, y))
+        right -= 2
+    # Remainder bits past the last codeword stay light.
+    for i, (x, y) in enumerate(data[:data_bits]):
+        rows[y * stride + x] = cols[x * stride + y] = i
+
+    masks = []
+    for test in _MASKS:
+        mask_rows, mask_cols = bytearray(b"0" * len(rows)), bytearray(b"0" * len(cols))
+        for x, y in data:
+            if test(x, y):
+                mask_rows[y * stride + x] = mask_cols[x * stride + y] = 49
+        masks.append((int(mask_rows, 2), int(mask_cols, 2)))
+
+    return _Layout(
+        size,
+        stride,
+        itemgetter(*rows),
+        itemgetter(*cols),
+        tuple(masks),
+        int(("1" * size + "0") * size, 2),
+    )
+
+
+@lru_cache(maxsize=None)
+def _format_patch(version: int, ecl_bits: int, mask: int) -> tuple[int, int]:
+    size = version * 4 + 17
+    stride = size + 1
+    last = size * stride - 1
+    rows = cols = 0
+    for x, y, dark in _format_modules(size, ecl_bits, mask):
+        if dark:
+            rows |= 1 << last - (y * stride + x)
+            cols |= 1 << last - (x * stride + y)
+    return rows, cols
+
+
+def _penalty(rows: int, cols: int, layout: _Layout) -> int:
+    """
+    Scores a masked symbol with the four penalty rules of ISO/IEC 18004, given its rows and
+    columns as packed integers (see :class:`_Layout`). Every rule is symmetric, so the
+    direction in which the bits are read does not matter.
+    """
+    valid = layout.valid
+    score = 0
+    for dark in (rows, cols):
+        light = ~dark & valid
+        for line in (dark, light):
+            # Each run of 5 + k same-colored modules scores 3 + k: one per 5-module window
+            # inside it, plus 2 per run.
+            windows = line & line >> 1 & line >> 2 & line >> 3 & line >> 4
+            score += windows.bit_count() + 2 * (windows & ~(windows >> 1)).bit_count()
+        # 1:1:3:1:1 finder-like patterns with 4 light modules on either side.
+        finder = dark & light >> 1 & dark >> 2 & dark >> 3 & dark >> 4 & light >> 5
+        finder &= dark >> 6
+        margin = light & light >> 1 & light >> 2 & light >> 3
+        score += 40 * (
+            (finder & margin >> 7).bit_count() + (finder >> 4 & margin).bit_count()
+        )
+
+    stride = layout.stride
+    for line in (rows, ~rows & valid):
+        blocks = line & line >> 1 & line >> stride & line >> stride + 1
+        score += 3 * blocks.bit_count()
+
+    dark, total = rows.bit_count(), layout.size * layout.size
+    score += ((abs(dark * 20 - total * 10) + total - 1) // total - 1) * 10
+    return score
+
+
+@lru_cache(maxsize=1024)
+def encode(data: str, error_correction: str = "L") -> tuple[tuple[bool, ...], ...]:
+    """
+    Encodes ``data`` as a QR code symbol.
+
+    The smallest version that fits is used, with numeric, alphanumeric or byte (UTF-8)
+    mode chosen from the content, and the mask with the lowest penalty score. Results
+    are cached per ``(data, error_correction)``.
+
+    Args:
+        data (``str``): The content to encode.
+        error_correction (``str``, *optional*): ``"L"``, ``"M"``, ``"Q"`` or ``"H"``. Defaults to ``"L"``.
+
+    Returns:
+        ``tuple``: Rows of the module matrix, ``True`` for dark modules.
+    """
+    ecl, ecl_bits = ERROR_CORRECTION[error_correction.upper()]
+    version, data_words = _codewords(data, ecl)
+    layout = _layout(version)
+
+    codewords = _interleave(version, ecl, data_words)
+    bits = format(int.from_bytes(bytes(codewords), "big"), f"0{len(codewords) * 8}b")
+    bits = bits.encode() + b"01"
+    rows, cols = int(bytes(layout.rows(bits)), 2), int(bytes(layout.cols(bits)), 2)
+
+    best, best_score = None, None
+    for mask, (mask_rows, mask_cols) in enumerate(layout.masks):
+        format_rows, format_cols = _format_patch(version, ecl_bits, mask)
+        masked = rows ^ mask_rows | format_rows
+        score = _penalty(masked, cols ^ mask_cols | format_cols, layout)
+        if best_score is None or score < best_score:
+            best, best_score = masked, score
+
+    size, stride = layout.size, layout.stride
+    modules = format(best, f"0{size * stride}b")
+    return tuple(
+        tuple(map("1".__eq__, modules[y * stride : y * stride + size]))
+        for y in range(size)
+    )
+
+
+def _parse_color(value: str) -> tuple[int, int, int]:
+    if "-" in value:
+        return tuple(int(part) for part in value.split("-")[:3])
+    value = value.lstrip("#")
+    return tuple(int(value[i : i + 2], 16) for i in (0, 2, 4))
+
+
+def render_qr(
+    data: str,
+    size: str = "150x150",
+    foreground_color: str = "000000",
+    background_color: str = "FFFFFF",
+    error_correction: str = "L",
+    quiet_zone: int = 4,
+) -> bytes:
+    """
+    Renders ``data`` as a PNG QR code.
+
+    Args:
+        data (``str``): The content to encode.
+        size (``str``, *optional*): Image size as ``"WIDTHxHEIGHT"``. Defaults to ``"150x150"``.
+        foreground_color (``str``, *optional*): Hex (``"000000"``) or decimal (``"0-0-0"``) color of dark modules.
+        background_color (``str``, *optional*): Hex or decimal color of light modules.
+        error_correction (``str``, *optional*): ``"L"``, ``"M"``, ``"Q"`` or ``"H"``. Defaults to ``"L"``.
+        quiet_zone (``int``, *optional*): Margin in modules. Defaults to 4.
+
+    Returns:
+        ``bytes``: The PNG image.
+    """
+    width, height = (int(v) for v in size.lower().split("x"))
+    modules = encode(data, error_correction)
+    count = len(modules) + 2 * quiet_zone
+
+    img = Image.new("P", (count, count), 0)
+    img.putpalette([*_parse_color(background_color), *_parse_color(foreground_color)])
+    img.putdata(
+        [0] * (quiet_zone * count)
+        + [
+            v
+            for row in modules
+            for v in [0] * quiet_zone + [int(m) for m in row] + [0] * quiet_zone
+        ]
+        + [0] * (quiet_zone * count)
+    )
+    img = img.resize((width, height), Image.NEAREST)
+
+    out = BytesIO()
+    img.save(out, format="PNG", optimize=True)
+    return out.getvalue()
@@ -0,0 +1,170 @@
+import textwrap
+from functools import lru_cache
+from io import BytesIO
+
+from PIL import Image, ImageDraw, ImageFont, ImageOps
+
+from ._assets import load_font, load_image
+
+BLACKPINK_FONT = "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf"
+
+_GRADIENT_START = (255, 148, 224)
+
+
+def _measure(
+    lines: list[str], font: ImageFont.FreeTypeFont
+) -> list[tuple[int, int, int, int]]:
+    return [font.getbbox(line) for line in lines]
+
+
+def _fits(
+    boxes: list[tuple[int, int, int, int]], max_width: int, max_height: int
+) -> bool:
+    height = sum(box[3] - box[1] for box in boxes)
+    return height <= max_height and all(box[2] <= max_width for box in boxes)
+
+
+def fit_text(
+    lines: list[str],
+    font_path: str,
+    max_width: int,
+    max_height: int,
+    max_size: int = 100,
+    min_size: int = 1,
+) -> tuple[ImageFont.FreeTypeFont, list[tuple[int, int, int, int]]]:
+    """
+    Finds the largest font size at which ``lines`` fit inside ``max_width`` x ``max_height``.
+
+    The size is binary-searched between ``min_size`` and ``max_size``; every line is
+    measured once per candidate size and fonts come from the process-wide font cache.
+
+    Returns:
+        ``tuple``: The fitted font and the bounding box of each line at that size.
+    """
+    best = None
+    low, high = min_size, max_size
+    while low <= high:
+        size = (low + high) // 2
+        font = load_font(font_path, size)
+        boxes = _measure(lines, font)
+        if _fits(boxes, max_width, max_height):
+            best = (font, boxes)
+            low = size + 1
+        else:
+            high = size - 1
+
+    if best is None:
+        font = load_font(font_path, min_size)
+        best = (font, _measure(lines, font))
+    return best
+
+
+@lru_cache(maxsize=16)
+def vertical_gradient(color: str, size: tuple[int, int]) -> Image.Image:
+    """
+    Returns a vertical gradient fading from pink at the top to ``color`` at the bottom.
+
+    A single column is computed per channel, merged and stretched to ``size``, and the
+    result is cached per ``(color, size)``. The returned image is shared, so callers
+    must copy it before drawing on it.
+    """
+    width, height = size
+    end = (int(color[1:3], 16), int(color[3:5], 16), int(color[5:7], 16))
+    bands = [
+        Image.frombytes(
+            "L",
+            (1, height),
+            bytes(int(s - (s - e) * (i / height)) for i in range(height)),
+        )
+        for s, e in zip(_GRADIENT_START, end)
+    ]
+    return Image.merge("RGB", bands).resize((width, height), Image.NEAREST)
+
+
+def render_blackpink(
+    text: str,
+    color: str = "#ff94e0",
+    border_color: str | None = None,
+    font_path: str = BLACKPINK_FONT,
+) -> bytes:
+    """Renders the :meth:`Client.blackpink` image and returns it JPEG-encoded."""
+    img_width = 800
+    img_height = 600
+
+    padding = 50
+    max_width = img_width - 2 * padding
+    max_height = img_height - 2 * padding
+
+    lines = textwrap.wrap(text, width=40)
+    font, boxes = fit_text(lines, font_path, max_width, max_height, max_size=100)
+    text_height = sum(box[3] - box[1] for box in boxes)
+
+    gradient = vertical_gradient(color, (img_width, img_height))
+
+    img = Image.new("RGB", (img_width, img_height), (0, 0, 0))
+    draw = ImageDraw.Draw(img)
+
+    y_text = (img_height - text_height) // 2
+    for line, bbox in zip(lines, boxes):
+        line_width = bbox[2] - bbox[0]
+        line_height = bbox[3] - bbox[1]
+        draw.text(
+            ((img_width - line_width) // 2, y_text),
+            line,
+            fill=color,
+            font=font,
+            align="center",
+        )
+        y_text += line_height
+
+    border_color = border_color or color
+    border_width = 28
+    img_with_border = ImageOps.expand(img, border=border_width, fill=border_color)
+
+    final_img = Image.new(
+        "RGB", (img_with_border.width, img_with_border.height), (0, 0, 0)
+    )
+    final_img.paste(gradient, (0, 0))
+    final_img.paste(img_with_border, (0, 0))
+
+    out = BytesIO()
+    final_img.save(out, format="JPEG")
+    return out.getvalue()
+
+
+def render_write(text: str, template_path: str, font_path: str) -> bytes:
+    """Renders the :meth:`Client.write` image and returns it JPEG-encoded."""
+    img = load_image(template_path)
+    draw = ImageDraw.Draw(img)
+    font = load_font(font_path, 24)
+
+    x, y = 150, 140
+    lines = []
+    if len(text) <= 55:
+        lines.append(text)
+    else:
+        all_lines = text.split("\n")
+        for line in all_lines:
+            if len(line) <= 55:
+                lines.append(line)
+            else:
+                k = len(line) // 55
+                lines.extend(line[((z - 1) * 55) : (z * 55)] for z in range(1, k + 2))
+
+    linespacing = 41
+    for line in lines[:25]:
+        draw.text((x, y), line, fill=(1, 22, 55), font=font)
+        y = y + linespacing
+
+    out = BytesIO()
+    img.save(out, format="JPEG")
+    return out.getvalue()
+
+
+def init_worker(images: list[str], fonts: dict[str, list[int]]):
+    """Decodes templates and loads fonts into this process's caches, e.g. as a pool initializer."""
+    for path in images:
+        load_image(path)
+    for path, sizes in fonts.items():
+        for size in sizes:
+            load_font(path, size)
@@ -1,4 +1,5 @@
-from typing import Any
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
 
 from httpx import AsyncClient, Response
 
@@ -76,3 +77,27 @@ class Request:
             verify=verify,
         )
         return r
+
+    @asynccontextmanager
+    async def stream(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str] | None = None,
+        params: dict[str, str] | None = None,
+        json: dict[str, Any] | None = None,
+        timeout: int | None = None,
+        allow_redirects: bool = True,
+        verify: bool | None = None,
+    ) -> AsyncIterator[Response]:
+        async with AsyncClient(verify=verify) as client:
+            async with client.stream(
+                method=method,
+                url=url,
+                headers=headers,
+                params=params,
+                json=json,
+                timeout=timeout,
+                follow_redirects=allow_redirects,
+            ) as response:
+                yield response
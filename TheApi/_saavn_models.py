@@ -0,0 +1,300 @@
+from typing import Any, Callable, Iterable, NamedTuple
+
+
+class Link(NamedTuple):
+    quality: str
+    url: str
+
+
+class AlbumRef(NamedTuple):
+    id: str
+    name: str
+    url: str | None
+
+
+class ArtistRef(NamedTuple):
+    id: str
+    name: str
+    role: str | None
+    url: str | None
+
+
+def _links(raw: list) -> tuple[Link, ...]:
+    return tuple(Link(item["quality"], item["url"]) for item in raw)
+
+
+def _album_ref(raw: dict) -> AlbumRef:
+    return AlbumRef(raw["id"], raw["name"], raw.get("url"))
+
+
+def _artist_refs(raw: dict | list) -> tuple[ArtistRef, ...]:
+    if isinstance(raw, dict):
+        raw = raw.get("all") or raw.get("primary", []) + raw.get("featured", [])
+    return tuple(
+        ArtistRef(item["id"], item["name"], item.get("role"), item.get("url"))
+        for item in raw
+    )
+
+
+def _songs(raw: list) -> tuple["Song", ...]:
+    return tuple(Song(item) for item in raw)
+
+
+def _albums(raw: list) -> tuple["Album", ...]:
+    return tuple(Album(item) for item in raw)
+
+
+class _Lazy:
+    """
+    A list of nested models kept as raw JSON until first read, then decoded once.
+
+    The value lives in the ``_<name>`` slot: a ``list`` while raw, a ``tuple`` once
+    decoded, or ``None`` when missing or projected out.
+    """
+
+    def __init__(self, key: str, decode):
+        self.key = key
+        self.decode = decode
+
+    def __set_name__(self, owner, name: str):
+        self.name = name
+        self.slot = "_" + name
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        value = getattr(obj, self.slot)
+        if isinstance(value, list):
+            value = self.decode(value)
+            setattr(obj, self.slot, value)
+        return value
+
+
+class _Model:
+    """
+    Base of the Saavn models.
+
+    ``FIELDS`` maps attribute names to payload keys. ``DECODED`` maps attribute names to a
+    payload key and a decoder that turns the small sub-objects (images, download URLs,
+    artist and album references) into named tuples up front, so no raw JSON stays
+    referenced. Nested model lists are :class:`_Lazy`. Anything else in the payload is
+    dropped.
+    """
+
+    __slots__ = ()
+    FIELDS: dict[str, str] = {}
+    DECODED: dict[str, tuple[str, Callable]] = {}
+    # Keys under which list responses carry the items, e.g. ``get_artist_songs``, tried in
+    # order and at every level, e.g. ``{"songs": {"results": [...]}}`` from ``search``.
+    LIST_KEYS: tuple[str, ...] = ("results",)
+    _LAZY: tuple[_Lazy, ...] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._LAZY = tuple(
+            value for value in vars(cls).values() if isinstance(value, _Lazy)
+        )
+
+    def __init__(self, data: dict, fields: Iterable[str] | None = None):
+        keep = None if fields is None else set(fields)
+        for name, key in self.FIELDS.items():
+            setattr(self, name, data.get(key) if keep is None or name in keep else None)
+        for name, (key, decode) in self.DECODED.items():
+            raw = data.get(key) if keep is None or name in keep else None
+            setattr(self, name, None if raw is None else decode(raw))
+        for lazy in self._LAZY:
+            setattr(
+                self,
+                lazy.slot,
+                data.get(lazy.key) if keep is None or lazy.name in keep else None,
+            )
+
+    @classmethod
+    def parse(cls, response: dict, fields: Iterable[str] | None = None) -> Any:
+        """
+        Builds models from a :class:`SaavnAPI` response.
+
+        Args:
+            response (``dict``): The response, e.g. from :meth:`SaavnAPI.search_songs`.
+            fields (``list``, *optional*): The attributes to keep; the rest are set to ``None``.
+                Defaults to all of them.
+
+        Returns:
+            The model for a single-entity response, a ``list`` of models for search results and
+            lists such as :meth:`SaavnAPI.get_artist_songs`, or ``None`` when the response was not
+            successful or holds no such entities.
+        """
+        if not response.get("success"):
+            return None
+        data = response.get("data")
+        while isinstance(data, dict) and "id" not in data:
+            key = next((key for key in cls.LIST_KEYS if key in data), None)
+            if key is None:
+                return None
+            data = data[key]
+        if isinstance(data, list):
+            return [cls(item, fields) for item in data]
+        if isinstance(data, dict):
+            return cls(data, fields)
+        return None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(id={self.id!r}, name={self.name!r})"
+
+
+class Song(_Model):
+    """
+    A Saavn song.
+
+    The album, images, download URLs and artists are :class:`AlbumRef`, :class:`Link` and
+    :class:`ArtistRef` tuples. :meth:`parse` also accepts :meth:`SaavnAPI.get_artist_songs`.
+
+    Example:
+        .. code-block:: python
+
+           from TheApi import SaavnAPI, Song
+
+           api = SaavnAPI()
+
+           songs = Song.parse(await api.search_songs("Jannat Ve", limit=50), fields=["id", "name", "download_urls"])
+           print(songs[0].download_urls[-1].url)
+    """
+
+    __slots__ = (
+        "id",
+        "name",
+        "year",
+        "duration",
+        "language",
+        "url",
+        "explicit",
+        "play_count",
+        "has_lyrics",
+        "album",
+        "images",
+        "download_urls",
+        "artists",
+    )
+    FIELDS = {
+        "id": "id",
+        "name": "name",
+        "year": "year",
+        "duration": "duration",
+        "language": "language",
+        "url": "url",
+        "explicit": "explicitContent",
+        "play_count": "playCount",
+        "has_lyrics": "hasLyrics",
+    }
+    DECODED = {
+        "album": ("album", _album_ref),
+        "images": ("image", _links),
+        "download_urls": ("downloadUrl", _links),
+        "artists": ("artists", _artist_refs),
+    }
+    LIST_KEYS = ("results", "songs")
+
+
+class Album(_Model):
+    """
+    A Saavn album. Its songs are decoded on first access. :meth:`parse` also accepts
+    :meth:`SaavnAPI.get_artist_albums`.
+    """
+
+    __slots__ = (
+        "id",
+        "name",
+        "description",
+        "year",
+        "language",
+        "url",
+        "song_count",
+        "explicit",
+        "play_count",
+        "images",
+        "artists",
+        "_songs",
+    )
+    FIELDS = {
+        "id": "id",
+        "name": "name",
+        "description": "description",
+        "year": "year",
+        "language": "language",
+        "url": "url",
+        "song_count": "songCount",
+        "explicit": "explicitContent",
+        "play_count": "playCount",
+    }
+    DECODED = {
+        "images": ("image", _links),
+        "artists": ("artists", _artist_refs),
+    }
+    LIST_KEYS = ("results", "albums")
+    songs = _Lazy("songs", _songs)
+
+
+class Artist(_Model):
+    """A Saavn artist. Top songs and top albums are decoded on first access."""
+
+    __slots__ = (
+        "id",
+        "name",
+        "url",
+        "follower_count",
+        "fan_count",
+        "verified",
+        "dominant_language",
+        "images",
+        "_top_songs",
+        "_top_albums",
+    )
+    FIELDS = {
+        "id": "id",
+        "name": "name",
+        "url": "url",
+        "follower_count": "followerCount",
+        "fan_count": "fanCount",
+        "verified": "isVerified",
+        "dominant_language": "dominantLanguage",
+    }
+    DECODED = {
+        "images": ("image", _links),
+    }
+    LIST_KEYS = ("results", "artists")
+    top_songs = _Lazy("topSongs", _songs)
+    top_albums = _Lazy("topAlbums", _albums)
+
+
+class Playlist(_Model):
+    """A Saavn playlist. Its songs are decoded on first access."""
+
+    __slots__ = (
+        "id",
+        "name",
+        "description",
+        "language",
+        "url",
+        "song_count",
+        "explicit",
+        "play_count",
+        "images",
+        "artists",
+        "_songs",
+    )
+    FIELDS = {
+        "id": "id",
+        "name": "name",
+        "description": "description",
+        "language": "language",
+        "url": "url",
+        "song_count": "songCount",
+        "explicit": "explicitContent",
+        "play_count": "playCount",
+    }
+    DECODED = {
+        "images": ("image", _links),
+        "artists": ("artists", _artist_refs),
+    }
+    LIST_KEYS = ("results", "playlists")
+    songs = _Lazy("songs", _songs)
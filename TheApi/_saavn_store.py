@@ -0,0 +1,215 @@
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entities (
+    type TEXT NOT NULL,
+    id TEXT NOT NULL,
+    data TEXT NOT NULL,
+    stored REAL NOT NULL,
+    PRIMARY KEY (type, id)
+);
+CREATE TABLE IF NOT EXISTS links (
+    url TEXT PRIMARY KEY,
+    type TEXT NOT NULL,
+    id TEXT NOT NULL
+);
+"""
+
+
+class SaavnStore:
+    """
+    A persistent SQLite store for the songs, albums, artists and lyrics :class:`SaavnAPI` resolves.
+
+    Entities are stored by type and ID, with their share links indexed so that they can also be
+    looked up by link. Every response that passes through :class:`SaavnAPI` is scanned for
+    complete songs and albums, so a song that appeared in an album or a search result is later
+    served without another request. Nested summaries, such as the albums listed on an artist,
+    are not complete and are never stored. Artists are stored only from
+    :meth:`SaavnAPI.get_artist` calls with the default paging, since their song and album lists
+    depend on it.
+
+    Args:
+        path (``str``, *optional*): The database file. Defaults to ``$XDG_CACHE_HOME/TheApi/saavn.sqlite3``
+            or ``~/.cache/TheApi/saavn.sqlite3``.
+        ttl (``dict``, *optional*): Per-type TTLs in seconds, merged over :attr:`DEFAULT_TTL`.
+            ``None`` keeps entities forever.
+
+    Example:
+        .. code-block:: python
+
+           from TheApi import SaavnAPI, SaavnStore
+
+           api = SaavnAPI(store=SaavnStore(ttl={"artist": 3600}))
+
+           await api.get_album(album_id="1142502")
+           song = await api.get_song_by_id("3IoDK8qI")  # served from the album response
+           print(api.store.stats())
+    """
+
+    DEFAULT_TTL = {
+        "song": 7 * 86400,
+        "album": 7 * 86400,
+        "artist": 86400,
+        "lyrics": 30 * 86400,
+    }
+
+    # A field only the full object has, per entity type picked up by :meth:`harvest`.
+    COMPLETE = {
+        "song": "downloadUrl",
+        "album": "songs",
+    }
+
+    def __init__(
+        self, path: str | None = None, ttl: dict[str, float | None] | None = None
+    ):
+        self.path = path or os.path.join(
+            os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")),
+            "TheApi",
+            "saavn.sqlite3",
+        )
+        self.ttl = {**self.DEFAULT_TTL, **(ttl or {})}
+        self.hits = 0
+        self.misses = 0
+
+        if os.path.dirname(self.path):
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.executescript(_SCHEMA)
+
+    def _fresh(self, type: str, stored: float) -> bool:
+        ttl = self.ttl.get(type)
+        return ttl is None or time.time() - stored <= ttl
+
+    def _get_many(self, type: str, ids: list[str]) -> dict[str, Any]:
+        found = {}
+        with self._lock:
+            for start in range(0, len(ids), 500):
+                chunk = ids[start : start + 500]
+                rows = self._db.execute(
+                    "SELECT id, data, stored FROM entities WHERE type = ? AND id IN "
+                    f"({', '.join('?' * len(chunk))})",
+                    (type, *chunk),
+                ).fetchall()
+                for entity_id, data, stored in rows:
+                    if self._fresh(type, stored):
+                        found[entity_id] = json.loads(data)
+        self.hits += len(found)
+        self.misses += len(set(ids)) - len(found)
+        return found
+
+    def _resolve_link(self, type: str, url: str) -> str | None:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT id FROM links WHERE url = ? AND type = ?", (url, type)
+            ).fetchone()
+        return row[0] if row else None
+
+    def _put_many(self, entries: list[tuple[str, str, Any, str | None]]):
+        now = time.time()
+        with self._lock, self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO entities VALUES (?, ?, ?, ?)",
+                [
+                    (type, str(entity_id), json.dumps(data), now)
+                    for type, entity_id, data, _ in entries
+                ],
+            )
+            self._db.executemany(
+                "INSERT OR REPLACE INTO links VALUES (?, ?, ?)",
+                [
+                    (link, type, str(entity_id))
+                    for type, entity_id, _, link in entries
+                    if link
+                ],
+            )
+
+    def _collect(self, payload: Any) -> list[tuple[str, str, Any, str | None]]:
+        entries, stack = [], [payload]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, list):
+                stack.extend(node)
+                continue
+            if not isinstance(node, dict):
+                continue
+            type = node.get("type")
+            if type in self.COMPLETE and "id" in node and self.COMPLETE[type] in node:
+                entries.append((type, node["id"], node, node.get("url")))
+            stack.extend(
+                value for value in node.values() if isinstance(value, (dict, list))
+            )
+        return entries
+
+    async def get(self, type: str, entity_id: str) -> Any | None:
+        """Returns the stored ``type`` entity with ID ``entity_id``, or ``None`` on a miss."""
+        found = await asyncio.to_thread(self._get_many, type, [entity_id])
+        return found.get(entity_id)
+
+    async def get_many(self, type: str, ids: list[str]) -> dict[str, Any]:
+        """Returns the stored ``type`` entities among ``ids``, keyed by ID."""
+        return await asyncio.to_thread(self._get_many, type, list(ids))
+
+    async def get_by_link(self, type: str, url: str) -> Any | None:
+        """Returns the stored ``type`` entity whose share link is ``url``, or ``None`` on a miss."""
+        entity_id = await asyncio.to_thread(self._resolve_link, type, url)
+        if entity_id is None:
+            self.misses += 1
+            return None
+        return await self.get(type, entity_id)
+
+    async def put(self, type: str, entity_id: str, data: Any, link: str | None = None):
+        """Stores ``data`` as the ``type`` entity ``entity_id``, optionally indexed by ``link``."""
+        await asyncio.to_thread(self._put_many, [(type, entity_id, data, link)])
+
+    async def harvest(self, payload: Any) -> int:
+        """
+        Stores every complete song and album found anywhere in ``payload``.
+
+        Returns:
+            ``int``: The number of entities stored.
+        """
+        entries = self._collect(payload)
+        if entries:
+            await asyncio.to_thread(self._put_many, entries)
+        return len(entries)
+
+    def clear(self):
+        """Removes every stored entity and link."""
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM entities")
+            self._db.execute("DELETE FROM links")
+
+    def stats(self) -> dict:
+        """
+        Returns store statistics.
+
+        Returns:
+            ``dict``: ``entities`` per type, ``links``, ``hits``, ``misses`` and ``hit_rate``.
+        """
+        with self._lock:
+            counts = dict(
+                self._db.execute(
+                    "SELECT type, COUNT(*) FROM entities GROUP BY type"
+                ).fetchall()
+            )
+            links = self._db.execute("SELECT COUNT(*) FROM links").fetchone()[0]
+        lookups = self.hits + self.misses
+        return {
+            "entities": counts,
+            "links": links,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def close(self):
+        """Closes the database connection."""
+        with self._lock:
+            self._db.close()
@@ -0,0 +1,85 @@
+import re
+from urllib.parse import urlsplit, urlunsplit
+
+SCREENS = {
+    # common
+    "meta_thumbnail": (1200, 628),
+    "desktop": (1440, 1024),
+    "mackbook_pro": (1152, 700),
+    "surface_book": (1500, 1000),
+    "imac": (1280, 720),
+    "androvalue": (480, 1024),
+    "ipad": (414, 736),
+    "iphone": (480, 1024),
+    # Desktop and Laptop Resolutions
+    "24_desktop": (1920, 1200),
+    "23_desktop": (1920, 1080),
+    "22_desktop": (1680, 1050),
+    "20_desktop": (1600, 900),
+    "19_desktop": (1440, 900),
+    "15_notebook": (1366, 768),
+    "13_notebook": (1024, 800),
+    "10_notebook": (1024, 600),
+    # iPad/Tablets Resolutions
+    "ipad_pro": (1024, 1366),
+    "ipad_mini_air": (768, 1024),
+    "samsung_galaxy_10": (800, 1280),
+    "nexus_7": (600, 960),
+    "nexus_9": (768, 1024),
+    # Mobile Resolutions
+    "google_pixel": (411, 731),
+    "iphone_x": (375, 812),
+    "iphone_6_plus": (414, 736),
+    "iphone_7_8_6": (375, 667),
+    "iphone_5": (320, 568),
+    "iphone_4_3": (320, 480),
+}
+
+URL_PATTERN = re.compile(
+    r"^(https?:\/\/)?(([a-z\d]([a-z\d-]*[a-z\d])*)\.)+[a-z]{2,}(:\d+)?(\/[-a-z\d%_.~+]*)*(\?[;&a-z\d%_.~+=-]*)?(\#[-a-z\d_]*)?$",
+    re.IGNORECASE,
+)
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def screen_size(screen: str) -> tuple[int, int]:
+    """
+    Resolves a :data:`SCREENS` preset name or a ``"width×height"`` string to a size.
+
+    Raises:
+        ValueError: If ``screen`` is neither.
+    """
+    if "×" in screen:
+        try:
+            width, height = map(int, screen.split("×"))
+        except ValueError:
+            raise ValueError("Invalid custom resolution format. Use 'width×height'.")
+        return width, height
+    size = SCREENS.get(screen)
+    if not size:
+        raise ValueError(f"Invalid screen value: {screen}")
+    return size
+
+
+def normalize_url(url: str) -> str:
+    """
+    Validates ``url`` and returns it in a canonical form.
+
+    The scheme defaults to https, the scheme and host are lowercased, a default port
+    is dropped and an empty path becomes ``/``, so equivalent URLs compare equal.
+
+    Raises:
+        ValueError: If ``url`` is not a valid web URL.
+    """
+    url = url.strip()
+    if not URL_PATTERN.match(url):
+        raise ValueError("Invalid URL provided.")
+    if not url.lower().startswith(("http://", "https://")):
+        url = "https://" + url
+
+    parts = urlsplit(url)
+    scheme, host = parts.scheme.lower(), parts.hostname
+    if parts.port and parts.port != _DEFAULT_PORTS[scheme]:
+        host = f"{host}:{parts.port}"
+    return urlunsplit((scheme, host, parts.path or "/", parts.query, parts.fragment))
@@ -0,0 +1,221 @@
+import asyncio
+import itertools
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
+
+from httpx import AsyncClient, HTTPError, Response
+
+# Status codes scraped sites answer with when they throttle a client.
+THROTTLE_STATUSES = (403, 429, 503)
+
+USER_AGENTS = [
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:66.0) Gecko/20100101 Firefox/66.0",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/111.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/111.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/109.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/111.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/111.0.0.0 Safari/537.36 Edg/111.0.1661.62",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) Gecko/20100101 Firefox/111.0",
+]
+
+
+class ScraperSession:
+    """
+    One scraping identity: a keep-alive :class:`httpx.AsyncClient` with its own cookie jar,
+    User-Agent and optional proxy, plus the health statistics :class:`SessionPool` routes by.
+    """
+
+    def __init__(self, user_agent: str, proxy: str | None = None):
+        self.user_agent = user_agent
+        self.proxy = proxy
+        self.requests = 0
+        self.successes = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.strikes = 0
+        self.latency = None
+        self.in_flight = 0
+        self.quarantined_until = 0.0
+        self._client: AsyncClient | None = None
+
+    @property
+    def client(self) -> AsyncClient:
+        if self._client is None:
+            self._client = AsyncClient(
+                headers={"User-Agent": self.user_agent},
+                proxy=self.proxy,
+                follow_redirects=True,
+            )
+        return self._client
+
+    @property
+    def quarantined(self) -> bool:
+        return time.monotonic() < self.quarantined_until
+
+    def score(self, default_latency: float) -> float:
+        """Higher is better: smoothed success rate over expected latency and current load."""
+        success_rate = (self.successes + 1) / (self.requests + 2)
+        latency = self.latency or default_latency
+        return success_rate / (latency * (1 + self.in_flight))
+
+    def record(self, ok: bool, latency: float, quarantine: float, max_failures: int):
+        self.requests += 1
+        self.latency = (
+            latency if self.latency is None else 0.8 * self.latency + 0.2 * latency
+        )
+        if ok:
+            self.successes += 1
+            self.consecutive_failures = self.strikes = 0
+            return
+        self.failures += 1
+        self.consecutive_failures += 1
+        if self.consecutive_failures >= max_failures:
+            # Back off exponentially while the session keeps failing after release.
+            self.strikes += 1
+            self.consecutive_failures = 0
+            self.quarantined_until = time.monotonic() + min(
+                quarantine * 2 ** (self.strikes - 1), quarantine * 32
+            )
+
+    def stats(self) -> dict:
+        return {
+            "user_agent": self.user_agent,
+            "proxy": self.proxy,
+            "requests": self.requests,
+            "successes": self.successes,
+            "failures": self.failures,
+            "latency": self.latency,
+            "in_flight": self.in_flight,
+            "quarantined": self.quarantined,
+        }
+
+    async def close(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+class SessionPool:
+    """
+    A pool of :class:`ScraperSession` objects for the scraped endpoints of :class:`Client`.
+
+    Each session keeps its own cookies, User-Agent, optional proxy and keep-alive
+    connections. Every request is routed to the healthiest session, scored by success
+    rate, smoothed latency and requests in flight. A session that fails ``max_failures``
+    times in a row (transport errors or throttling responses such as 429, or a redirect
+    to a captcha page) is quarantined for ``quarantine`` seconds, doubling on each repeat,
+    and the request is retried on another session.
+
+    Args:
+        user_agents (``list``, *optional*): User-Agents to give the sessions. Defaults to :data:`USER_AGENTS`.
+        size (``int``, *optional*): Number of sessions. Defaults to one per User-Agent, or per proxy.
+        proxies (``list``, *optional*): Proxy URLs, assigned to sessions round-robin.
+        quarantine (``float``, *optional*): Base quarantine in seconds. Defaults to 60.
+        max_failures (``int``, *optional*): Consecutive failures before quarantine. Defaults to 2.
+        retries (``int``, *optional*): Extra attempts on other sessions per request. Defaults to 2.
+
+    Example:
+        .. code-block:: python
+
+           from TheApi import Client, SessionPool
+
+           api = Client(sessions=SessionPool(proxies=["http://proxy-1:8080", "http://proxy-2:8080"]))
+           await api.google_search("Python programming", limit=50)
+           print(api.sessions.stats())
+           await api.sessions.close()
+    """
+
+    def __init__(
+        self,
+        user_agents: list[str] | None = None,
+        size: int | None = None,
+        proxies: list[str] | None = None,
+        quarantine: float = 60,
+        max_failures: int = 2,
+        retries: int = 2,
+    ):
+        user_agents = user_agents or USER_AGENTS
+        size = size or max(len(user_agents), len(proxies or ()))
+        agents = itertools.cycle(user_agents)
+        proxy_cycle = itertools.cycle(proxies or [None])
+        self.sessions = [
+            ScraperSession(next(agents), next(proxy_cycle)) for _ in range(size)
+        ]
+        self.quarantine = quarantine
+        self.max_failures = max_failures
+        self.retries = retries
+
+    def _pick(self, exclude: set) -> ScraperSession:
+        candidates = [s for s in self.sessions if s not in exclude] or self.sessions
+        healthy = [s for s in candidates if not s.quarantined]
+        if not healthy:
+            # Everything is quarantined: probe the session released soonest.
+            return min(candidates, key=lambda s: s.quarantined_until)
+        # Untried sessions are assumed to be as fast as the fastest known one.
+        default_latency = min(
+            (s.latency for s in self.sessions if s.latency), default=1.0
+        )
+        return max(healthy, key=lambda s: s.score(default_latency))
+
+    @staticmethod
+    def throttled(response: Response) -> bool:
+        """Returns whether ``response`` looks like the site is throttling the session."""
+        return response.status_code in THROTTLE_STATUSES or "/sorry/" in str(
+            response.url
+        )
+
+    @asynccontextmanager
+    async def stream(
+        self, method: str, url: str, **kwargs: Any
+    ) -> AsyncIterator[Response]:
+        """
+        Sends a request through the healthiest session and yields the streamed response.
+
+        ``kwargs`` are passed to :meth:`httpx.AsyncClient.stream`. Throttled responses and
+        transport errors are retried on other sessions; the last response is yielded, or the
+        last error raised, once the retries are used up.
+        """
+        tried = set()
+        for attempt in range(self.retries + 1):
+            session = self._pick(tried)
+            tried.add(session)
+            last = attempt == self.retries
+            ok = delivered = False
+            latency = None
+            session.in_flight += 1
+            started = time.monotonic()
+            try:
+                async with session.client.stream(method, url, **kwargs) as response:
+                    latency = time.monotonic() - started
+                    ok = not self.throttled(response)
+                    if ok or last:
+                        delivered = True
+                        yield response
+                        return
+            except HTTPError:
+                ok = False
+                if delivered or last:
+                    raise
+            finally:
+                session.in_flight -= 1
+                session.record(
+                    ok,
+                    latency or time.monotonic() - started,
+                    self.quarantine,
+                    self.max_failures,
+                )
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> Response:
+        """Like :meth:`stream`, but reads and returns the whole response."""
+        async with self.stream(method, url, **kwargs) as response:
+            await response.aread()
+            return response
+
+    def stats(self) -> list[dict]:
+        """Returns the health statistics of every session."""
+        return [session.stats() for session in self.sessions]
+
+    async def close(self):
+        """Closes the connections of every session."""
+        await asyncio.gather(*(session.close() for session in self.sessions))
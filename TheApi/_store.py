@@ -0,0 +1,372 @@
+import asyncio
+import hashlib
+import os
+import random
+import re
+import secrets
+import string
+import time
+from contextlib import contextmanager
+from typing import AsyncIterable
+
+import aiofiles
+
+_DIGEST_NAME = re.compile(r"_([0-9a-f]{32})\.[^.]+$")
+# A temporary file of ``_new_path``'s naming scheme, left behind by an interrupted write.
+_TMP_NAME = re.compile(
+    r"^.+_(?:[A-Za-z0-9]{8}|[0-9a-f]{32})\.[^.]+\.\d+\.[0-9a-f]{8}\.tmp$"
+)
+
+
+def _tmp_path(path: str) -> str:
+    # Unique per write: concurrent writes of identical contents share one target path.
+    return f"{path}.{os.getpid()}.{secrets.token_hex(4)}.tmp"
+
+
+# Names of the files the store has written, one per line, kept in the downloads directory.
+MANIFEST = ".theapi-downloads"
+
+
+class DownloadStore:
+    """
+    Manages the files that :class:`Client` writes into its downloads directory.
+
+    When ``max_size`` or ``max_age`` is set, every written file is tracked with its size
+    and last access time, and a background task periodically removes files older than
+    ``max_age`` and evicts the least recently used files until the directory fits in
+    ``max_size``. Pinned files are never removed. Without limits nothing is tracked.
+
+    Only files the store wrote itself are managed: their names are recorded in a manifest
+    in the directory, and on startup only files listed there are picked up again, so
+    other files in a shared directory are never removed. The manifest is rewritten after
+    the background task removes files.
+
+    Files are written to a temporary file and atomically renamed into place, so readers
+    never see partial writes. In ``content_addressed`` mode the file name is derived from
+    the SHA-256 of the contents: writing identical contents again returns the existing
+    file, and identical contents under another name prefix are hardlinked.
+
+    Args:
+        directory (``str``): The downloads directory.
+        max_size (``int``, *optional*): Maximum total size in bytes. Defaults to unlimited.
+        max_age (``float``, *optional*): Maximum age in seconds since a file was last written or
+            touched. Defaults to unlimited.
+        interval (``float``, *optional*): Seconds between background collections. Defaults to 60.
+        content_addressed (``bool``, *optional*): Name files after their content hash and
+            deduplicate identical outputs. Defaults to False.
+
+    Example:
+        .. code-block:: python
+
+           api = Client(max_downloads_size=500 * 1024 * 1024, max_downloads_age=3600)
+
+           path = await api.blackpink("Jennie")
+           with api.downloads.pinned(path):
+               await send_photo(path)
+
+           print(api.downloads.stats())
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        max_size: int | None = None,
+        max_age: float | None = None,
+        interval: float = 60,
+        content_addressed: bool = False,
+    ):
+        self.directory = directory
+        self.max_size = max_size
+        self.max_age = max_age
+        self.interval = interval
+        self.content_addressed = content_addressed
+        self.evicted = 0
+        self.freed = 0
+
+        self._files: dict[str, tuple[int, float]] = {}
+        self._size = 0
+        self._pins: dict[str, int] = {}
+        self._digests: dict[str, str] = {}
+        self._task: asyncio.Task | None = None
+        self._manifest_lock = asyncio.Lock()
+        self._stale = False
+
+        os.makedirs(self.directory, exist_ok=True)
+        self._manifest = os.path.join(self.directory, MANIFEST)
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self._manifest) as f:
+                written = set(f.read().split("\n"))
+        except FileNotFoundError:
+            written = set()
+
+        for entry in os.scandir(self.directory):
+            if not entry.is_file():
+                continue
+            if _TMP_NAME.match(entry.name):
+                if entry.stat().st_mtime < time.time() - 3600:
+                    os.remove(entry.path)
+                continue
+            if not self._limited or entry.name not in written:
+                continue
+            stat = entry.stat()
+            self._track(entry.path, stat.st_size, stat.st_mtime)
+            match = _DIGEST_NAME.search(entry.name)
+            if match:
+                self._digests.setdefault(match.group(1), entry.path)
+
+        if self._limited:
+            # Drop the names of files that no longer exist.
+            self._write_manifest(list(self._files))
+
+    @property
+    def _limited(self) -> bool:
+        return self.max_size is not None or self.max_age is not None
+
+    def _write_manifest(self, paths: list[str]):
+        tmp_path = _tmp_path(self._manifest)
+        with open(tmp_path, "w") as f:
+            f.writelines(os.path.basename(path) + "\n" for path in paths)
+        os.replace(tmp_path, self._manifest)
+
+    def _append_manifest(self, path: str):
+        with open(self._manifest, "a") as f:
+            f.write(os.path.basename(path) + "\n")
+
+    async def _record(self, path: str, size: int):
+        if not self._limited:
+            return
+        new = path not in self._files
+        self._track(path, size, time.time())
+        if new:
+            async with self._manifest_lock:
+                await asyncio.to_thread(self._append_manifest, path)
+
+    async def _compact(self):
+        # The snapshot is taken under the lock, so no concurrent append is lost.
+        async with self._manifest_lock:
+            self._stale = False
+            await asyncio.to_thread(self._write_manifest, list(self._files))
+
+    def _track(self, path: str, size: int, accessed: float):
+        if path in self._files:
+            self._size -= self._files[path][0]
+        self._files[path] = (size, accessed)
+        self._size += size
+
+    def _forget(self, path: str):
+        size, _ = self._files.pop(path)
+        self._size -= size
+        self._stale = True
+        match = _DIGEST_NAME.search(path)
+        if match and self._digests.get(match.group(1)) == path:
+            del self._digests[match.group(1)]
+
+    def _new_path(self, ext: str, name: str | None, digest: str | None = None) -> str:
+        suffix = digest or "".join(
+            random.choices(string.ascii_letters + string.digits, k=8)
+        )
+        return os.path.join(self.directory, f"{name or 'file'}_{suffix}.{ext}")
+
+    async def _write_atomic(self, path: str, contents: bytes, replace: bool = True):
+        tmp_path = _tmp_path(path)
+        try:
+            async with aiofiles.open(tmp_path, "wb") as f:
+                await f.write(contents)
+            # A content-addressed target written meanwhile already holds these contents.
+            if replace or not os.path.isfile(path):
+                os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _link(self, digest: str, path: str) -> bool:
+        source = self._digests.get(digest)
+        if not source or not os.path.isfile(source):
+            return False
+        try:
+            os.link(source, path)
+        except FileExistsError:
+            # Another write of the same contents got there first.
+            return True
+        except OSError:
+            return False
+        return True
+
+    async def write(self, contents: bytes, ext: str, name: str | None = None) -> str:
+        """
+        Writes ``contents`` to a new file in the downloads directory.
+
+        Args:
+            contents (``bytes``): The file contents.
+            ext (``str``): The file extension.
+            name (``str``, *optional*): Prefix for the file name. Defaults to ``"file"``.
+
+        Returns:
+            ``str``: The path of the written file.
+        """
+        digest = None
+        if self.content_addressed:
+            digest = hashlib.sha256(contents).hexdigest()[:32]
+        file_path = self._new_path(ext, name, digest)
+
+        if digest and os.path.isfile(file_path):
+            await self._record(file_path, len(contents))
+            return file_path
+        if not (digest and self._link(digest, file_path)):
+            await self._write_atomic(file_path, contents, replace=not digest)
+        if digest:
+            self._digests.setdefault(digest, file_path)
+
+        await self._record(file_path, len(contents))
+        self._ensure_collector()
+        return file_path
+
+    async def write_chunks(
+        self, chunks: AsyncIterable[bytes], ext: str, name: str | None = None
+    ) -> str:
+        """
+        Writes the chunks of an async iterable to a new file in the downloads directory.
+
+        The contents are never held in memory as a whole. In ``content_addressed`` mode
+        the digest is computed while writing.
+
+        Args:
+            chunks (``AsyncIterable[bytes]``): The file contents.
+            ext (``str``): The file extension.
+            name (``str``, *optional*): Prefix for the file name. Defaults to ``"file"``.
+
+        Returns:
+            ``str``: The path of the written file.
+        """
+        file_path = self._new_path(ext, name)
+        tmp_path = _tmp_path(file_path)
+        sha256 = hashlib.sha256() if self.content_addressed else None
+        size = 0
+        try:
+            async with aiofiles.open(tmp_path, "wb") as f:
+                async for chunk in chunks:
+                    if sha256:
+                        sha256.update(chunk)
+                    size += len(chunk)
+                    await f.write(chunk)
+
+            if sha256:
+                digest = sha256.hexdigest()[:32]
+                file_path = self._new_path(ext, name, digest)
+                if os.path.isfile(file_path) or self._link(digest, file_path):
+                    os.remove(tmp_path)
+                self._digests.setdefault(digest, file_path)
+            if os.path.exists(tmp_path):
+                os.replace(tmp_path, file_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+        await self._record(file_path, size)
+        self._ensure_collector()
+        return file_path
+
+    def touch(self, path: str):
+        """Marks ``path`` as recently used so it is evicted last."""
+        if path in self._files:
+            self._files[path] = (self._files[path][0], time.time())
+
+    def pin(self, path: str):
+        """Protects ``path`` from removal until :meth:`unpin` is called as many times."""
+        self._pins[path] = self._pins.get(path, 0) + 1
+        self.touch(path)
+
+    def unpin(self, path: str):
+        """Releases one :meth:`pin` on ``path``."""
+        count = self._pins.get(path, 0) - 1
+        if count > 0:
+            self._pins[path] = count
+        else:
+            self._pins.pop(path, None)
+
+    @contextmanager
+    def pinned(self, path: str):
+        """Context manager that pins ``path`` for the duration of the block."""
+        self.pin(path)
+        try:
+            yield path
+        finally:
+            self.unpin(path)
+
+    def _remove(self, path: str):
+        size, _ = self._files[path]
+        self._forget(path)
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            return
+        self.evicted += 1
+        self.freed += size
+
+    def collect(self) -> dict:
+        """
+        Removes expired files, then evicts least recently used files over ``max_size``.
+
+        Returns:
+            ``dict``: The number of ``removed`` files and ``freed`` bytes in this run.
+        """
+        evicted, freed = self.evicted, self.freed
+        candidates = sorted(
+            (path for path in self._files if path not in self._pins),
+            key=lambda path: self._files[path][1],
+        )
+
+        if self.max_age is not None:
+            deadline = time.time() - self.max_age
+            while candidates and self._files[candidates[0]][1] < deadline:
+                self._remove(candidates.pop(0))
+
+        if self.max_size is not None:
+            for path in candidates:
+                if self._size <= self.max_size:
+                    break
+                self._remove(path)
+
+        return {"removed": self.evicted - evicted, "freed": self.freed - freed}
+
+    def _ensure_collector(self):
+        if not self._limited:
+            return
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._collector())
+
+    async def _collector(self):
+        while True:
+            self.collect()
+            if self._stale:
+                await self._compact()
+            await asyncio.sleep(self.interval)
+
+    async def stop(self):
+        """Stops the background collection task and waits for it to finish."""
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    def stats(self) -> dict:
+        """
+        Returns store statistics.
+
+        Returns:
+            ``dict``: ``files``, ``size``, ``pinned``, ``evicted`` and ``freed`` (bytes) totals.
+        """
+        return {
+            "files": len(self._files),
+            "size": self._size,
+            "pinned": len(self._pins),
+            "evicted": self.evicted,
+            "freed": self.freed,
+        }
@@ -0,0 +1,147 @@
+import re
+from binascii import a2b_base64
+from typing import AsyncIterable, AsyncIterator
+
+_ESCAPE = re.compile(rb"\\(u[0-9a-fA-F]{4}|.)", re.S)
+_WHITESPACE = b" \t\r\n"
+
+
+def _unescape(match: re.Match) -> bytes:
+    escape = match.group(1)
+    if escape[:1] == b"u":
+        return chr(int(escape[1:], 16)).encode()
+    if escape in b"nrtbf":
+        return b""
+    return escape
+
+
+class Base64FieldDecoder:
+    """
+    Incrementally decodes a base64 string value out of a streamed JSON document.
+
+    Chunks of the raw document are passed to :meth:`feed`, which returns the bytes
+    decoded so far. Only the unparsed head of the document and at most three
+    undecoded base64 characters are buffered. A ``data:...;base64,`` prefix on the
+    value is skipped and JSON escapes such as ``\\/`` are honoured.
+
+    Args:
+        field (``str``): Name of the JSON key holding the base64 value.
+    """
+
+    max_head = 64 * 1024
+
+    def __init__(self, field: str):
+        self.field = field
+        self.done = False
+        self._key = re.compile(rb'"%s"\s*:\s*"' % re.escape(field.encode()))
+        self._head = b""
+        self._found = False
+        self._prefix = b""
+        self._prefixed = False
+        self._pending = b""
+        self._escape = b""
+
+    def feed(self, chunk: bytes) -> bytes:
+        """Consumes the next chunk of the document and returns newly decoded bytes."""
+        if self.done:
+            return b""
+        if not self._found:
+            self._head += chunk
+            match = self._key.search(self._head)
+            if not match:
+                if len(self._head) > self.max_head:
+                    self._head = self._head[-1024:]
+                return b""
+            chunk, self._head, self._found = self._head[match.end() :], b"", True
+
+        end = chunk.find(b'"')
+        if end != -1:
+            chunk, self.done = chunk[:end], True
+
+        if not self._prefixed:
+            self._prefix += chunk
+            if self._prefix.startswith(b"data:"[: len(self._prefix)]) and not self.done:
+                if len(self._prefix) < 5 or b"," not in self._prefix:
+                    return b""
+            if self._prefix.startswith(b"data:"):
+                chunk = self._prefix.partition(b",")[2]
+            else:
+                chunk = self._prefix
+            self._prefix, self._prefixed = b"", True
+
+        return self._decode(chunk)
+
+    def _decode(self, chunk: bytes) -> bytes:
+        if self._escape:
+            chunk, self._escape = self._escape + chunk, b""
+        if b"\\" in chunk:
+            start = chunk.rfind(b"\\")
+            width = 6 if chunk[start + 1 : start + 2] == b"u" else 2
+            if len(chunk) - start < width and not self.done:
+                chunk, self._escape = chunk[:start], chunk[start:]
+            chunk = _ESCAPE.sub(_unescape, chunk)
+
+        data = self._pending + chunk.translate(None, _WHITESPACE)
+        if self.done:
+            self._pending = b""
+            if len(data) % 4:
+                data += b"=" * (-len(data) % 4)
+            return a2b_base64(data) if data else b""
+        cut = len(data) - len(data) % 4
+        self._pending = data[cut:]
+        return a2b_base64(data[:cut]) if cut else b""
+
+    def close(self):
+        """
+        Checks that the whole value was read.
+
+        Raises:
+            ValueError: If the document ended before the value was found or terminated.
+        """
+        if not self._found:
+            raise ValueError(f"Response has no '{self.field}' field")
+        if not self.done:
+            raise ValueError(f"Response ended inside the '{self.field}' field")
+
+
+async def decode_base64_field(
+    chunks: AsyncIterable[bytes], field: str
+) -> AsyncIterator[bytes]:
+    """
+    Yields the decoded bytes of the base64 ``field`` of a JSON document streamed as ``chunks``.
+
+    Iteration stops as soon as the value is complete, without reading the rest of the
+    document.
+    """
+    decoder = Base64FieldDecoder(field)
+    async for chunk in chunks:
+        data = decoder.feed(chunk)
+        if data:
+            yield data
+        if decoder.done:
+            break
+    decoder.close()
+
+
+async def iter_matches(
+    chunks: AsyncIterable[str], pattern: re.Pattern, start: str
+) -> AsyncIterator[str]:
+    """
+    Yields the matches of ``pattern`` in text streamed as ``chunks``, like :func:`re.findall`.
+
+    ``start`` is the literal text every match begins with. Text after the last match is
+    kept only from the last occurrence of ``start``, so a match split across chunks is
+    still found while memory stays bounded by the longest match.
+    """
+    group = 1 if pattern.groups else 0
+    buffer = ""
+    async for chunk in chunks:
+        buffer += chunk
+        end = 0
+        for match in pattern.finditer(buffer):
+            yield match.group(group)
+            end = match.end()
+        tail = buffer.rfind(start, end)
+        if tail == -1:
+            tail = max(end, len(buffer) - len(start) + 1)
+        buffer = buffer[tail:]
@@ -1,6 +1,60 @@
+import asyncio
+import time
 from io import BytesIO
 
 import aiofiles
+from PIL import Image, ImageOps
+
+_OPTIMIZE_FORMATS = {
+    "webp": "WEBP",
+    "jpeg": "JPEG",
+    "png": "PNG",
+}
+
+
+def _optimize_image(
+    data: bytes, image_format: str, quality: int, max_dimension: int | None
+) -> tuple[bytes, str]:
+    """
+    Returns the re-encoded image and its format, or the original bytes and format when
+    re-encoding does not make the image smaller.
+    """
+    with Image.open(BytesIO(data)) as src:
+        source_format = (src.format or image_format).lower()
+        img = ImageOps.exif_transpose(src)
+        img.load()
+
+    if max_dimension and max(img.size) > max_dimension:
+        img.thumbnail((max_dimension, max_dimension), Image.LANCZOS)
+
+    # Drop EXIF, ICC profiles and text chunks carried over from the source.
+    img.info = {}
+
+    pil_format = _OPTIMIZE_FORMATS[image_format]
+    if pil_format == "JPEG" and img.mode != "RGB":
+        if img.mode in ("RGBA", "LA", "P"):
+            img = img.convert("RGBA")
+            background = Image.new("RGB", img.size, (255, 255, 255))
+            background.paste(img, mask=img.getchannel("A"))
+            img = background
+        else:
+            img = img.convert("RGB")
+    elif pil_format == "WEBP" and img.mode not in ("RGB", "RGBA"):
+        img = img.convert("RGBA" if "A" in img.getbands() else "RGB")
+
+    options = {"optimize": True}
+    if pil_format == "JPEG":
+        options.update(quality=quality, progressive=True)
+    elif pil_format == "WEBP":
+        options = {"quality": quality, "method": 4}
+    else:
+        options["compress_level"] = 9
+
+    out = BytesIO()
+    img.save(out, format=pil_format, **options)
+    if out.tell() >= len(data):
+        return data, source_format
+    return out.getvalue(), image_format
 
 
 class UploadMedia:
@@ -21,10 +75,96 @@ class UploadMedia:
             err = "Invalid input type"
         return err, data
 
-    async def upload_image(self, file_path: str | bytes | BytesIO) -> dict:
-        return await self.upload_to_envsh(file_path)
+    async def optimize_image(
+        self,
+        file_input: str | bytes | BytesIO,
+        image_format: str = "webp",
+        quality: int = 80,
+        max_dimension: int | None = 2048,
+    ) -> dict:
+        """
+        Recompresses an image with Pillow to shrink it before uploading.
+
+        The image is downscaled so that its longest side is at most ``max_dimension``,
+        stripped of metadata and re-encoded. The encoding runs in a worker thread so the
+        event loop is not blocked. If the optimized image is not smaller than the original,
+        the original bytes are kept.
+
+        Args:
+            file_input (Union[str, bytes, BytesIO]): The image to optimize.
+            image_format (``str``, *optional*): Output format, one of ``"webp"``, ``"jpeg"`` or ``"png"``. Defaults to ``"webp"``.
+            quality (``int``, *optional*): Encoder quality (1-100) for WebP and JPEG. Defaults to 80.
+            max_dimension (``int``, *optional*): Maximum width or height in pixels. ``None`` disables downscaling. Defaults to 2048.
 
-    async def upload_to_envsh(self, file_path: str | bytes | BytesIO) -> dict:
+        Returns:
+            ``dict``: A dictionary containing:
+                - "success" (bool): True if the image was processed.
+                - "result" (bytes, optional): The (possibly) optimized image bytes.
+                - "format" (str, optional): The format of ``result``.
+                - "original_size" / "optimized_size" (int, optional): Sizes in bytes.
+                - "saved_bytes" (int, optional): Number of bytes saved.
+                - "elapsed" (float, optional): Seconds spent optimizing.
+                - "error" (str, optional): The error message if processing fails.
+
+        Example:
+            .. code-block:: python
+
+                result = await api.optimize_image("downloads/blackpink_Z6b6oUv7.jpg", quality=70)
+                print(result["saved_bytes"], result["elapsed"])
+        """
+        if image_format not in _OPTIMIZE_FORMATS:
+            return {
+                "success": False,
+                "error": f"Invalid image format '{image_format}'. Must be one of {', '.join(_OPTIMIZE_FORMATS)}",
+            }
+
+        err, data = await self._get_bytes(file_input)
+        if err:
+            return {"success": False, "error": str(err)}
+
+        start = time.perf_counter()
+        try:
+            optimized, result_format = await asyncio.to_thread(
+                _optimize_image, data, image_format, quality, max_dimension
+            )
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+        elapsed = time.perf_counter() - start
+
+        return {
+            "success": True,
+            "result": optimized,
+            "format": result_format,
+            "original_size": len(data),
+            "optimized_size": len(optimized),
+            "saved_bytes": len(data) - len(optimized),
+            "elapsed": round(elapsed, 4),
+        }
+
+    async def upload_image(
+        self,
+        file_path: str | bytes | BytesIO,
+        optimize: bool = False,
+        image_format: str = "webp",
+        quality: int = 80,
+        max_dimension: int | None = 2048,
+    ) -> dict:
+        return await self.upload_to_envsh(
+            file_path,
+            optimize=optimize,
+            image_format=image_format,
+            quality=quality,
+            max_dimension=max_dimension,
+        )
+
+    async def upload_to_envsh(
+        self,
+        file_path: str | bytes | BytesIO,
+        optimize: bool = False,
+        image_format: str = "webp",
+        quality: int = 80,
+        max_dimension: int | None = 2048,
+    ) -> dict:
         """Uploads an image to `Envs.sh <https://envs.sh>`_.
 
         Args:
@@ -33,12 +173,18 @@ class UploadMedia:
                 - str: Local file path (e.g., "image.png").
                 - bytes: Raw binary data of the file.
                 - BytesIO: File-like object containing binary data.
+            optimize (bool, optional): Recompress the image with :meth:`optimize_image` before uploading (default: False).
+            image_format (str, optional): Output format used when ``optimize`` is True (default: "webp").
+            quality (int, optional): Encoder quality used when ``optimize`` is True (default: 80).
+            max_dimension (int, optional): Maximum width or height used when ``optimize`` is True (default: 2048).
 
         Returns:
             dict: A dictionary containing the upload result:
                 - On success: {"success": true, "url": "<file_url>", "retention": "<days> days"}
                 - On failure: {"success": false, "error": "<error_message>"}
                 Retention period is calculated based on file size, ranging from 30 to 90 days.
+                When ``optimize`` is True, an "optimization" key reports the original size,
+                optimized size, bytes saved and the time spent.
 
         Examples:
 
@@ -98,6 +244,19 @@ class UploadMedia:
         if err:
             return {"success": False, "error": err}
 
+        report = None
+        if optimize:
+            report = await self.optimize_image(
+                image_bytes,
+                image_format=image_format,
+                quality=quality,
+                max_dimension=max_dimension,
+            )
+            if not report["success"]:
+                return report
+            image_bytes = report.pop("result")
+            report.pop("success")
+
         file_size = len(image_bytes)
         max_size, min_age, max_age = 512 * 1024 * 1024, 30, 90
         retention = min_age + (-max_age + min_age) * pow((file_size / max_size - 1), 3)
@@ -108,11 +267,14 @@ class UploadMedia:
 
         try:
             response = await self.request.post(url=url, files=files)
-            return {
+            result = {
                 "success": True,
                 "url": response.text.strip(),
                 "retention": f"{round(retention)} days",
             }
+            if optimize:
+                result["optimization"] = report
+            return result
         except Exception as e:
             return {"success": False, "error": str(e)}
 
@@ -1,18 +1,53 @@
+import asyncio
 import os
 import random
 import re
-import string
-import textwrap
-from base64 import b64decode
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import asynccontextmanager
 from io import BytesIO
+from typing import AsyncIterator, NamedTuple
 
 import aiofiles
-from bs4 import BeautifulSoup
-from PIL import Image, ImageDraw, ImageFont, ImageOps
-
+from httpx import URL, Response
+
+from ._assets import assets
+from ._cache import ResultCache, SearchCache
+from ._carbon import render_code
+from ._executor import Offloader
+from ._github import (
+    MAX_PER_PAGE,
+    PROJECTIONS,
+    SEARCH_TYPES,
+    page_urls,
+    search_endpoint,
+)
+from ._parse import (
+    BING_IMAGE_PATTERN,
+    BING_IMAGE_START,
+    parse_google_results,
+    parse_hashtags,
+    resolve_parser,
+)
+from ._qr import ERROR_CORRECTION, render_qr
+from ._render import init_worker, render_blackpink, render_write
 from ._request import Request
+from ._screens import normalize_url, screen_size
+from ._sessions import USER_AGENTS, SessionPool
+from ._store import DownloadStore
+from ._stream import decode_base64_field, iter_matches
 from ._upload import UploadMedia
 
+OUTPUT_MODES = ("path", "bytes", "bytesio")
+
+GOOGLE_PAGE_SIZE = 10
+BING_PAGE_SIZE = 35
+GITHUB_ETAG_CACHE_SIZE = 256
+SCREENSHOT_REUSE_SIZE = 1024
+STACKEXCHANGE_PAGE_SIZE = 100
+
 
 class Client(UploadMedia):
     """
@@ -20,9 +55,46 @@ class Client(UploadMedia):
 
     Args:
         downloads_dir (``str``, *optional*): Directory to save downloaded files. Defaults to "downloads".
+        quiet (``bool``, *optional*): Return error dicts instead of raising. Defaults to False.
+        offload (``dict``, *optional*): Where to run the CPU-bound stages of ``blackpink``, ``write``,
+            ``google_search``, ``hashtag``, and local ``carbon`` and ``gen_qr``. Maps method name to ``"thread"``,
+            ``"process"`` or ``"inline"``; unlisted methods use a thread pool.
+            Example: ``{"blackpink": "process", "google_search": "inline"}``.
+        result_cache (:class:`ResultCache`, *optional*): Cache for the results of ``carbon``, ``gen_qr``,
+            ``generate_pdf`` (HTML sources) and ``take_screenshot``. Disabled by default.
+        search_cache (:class:`SearchCache`, *optional*): Cache for the results of ``google_search``,
+            ``bing_image`` and ``hashtag``. Disabled by default.
+        sessions (:class:`SessionPool`, *optional*): Rotating scraper sessions for ``google_search``,
+            ``bing_image`` and ``hashtag``, with cookies, keep-alive connections and throttling-aware
+            routing. Defaults to a fresh connection per request with a random User-Agent.
+        max_downloads_size (``int``, *optional*): Maximum total size of ``downloads_dir`` in bytes.
+            Least recently used files are removed by a background task. Defaults to unlimited.
+        max_downloads_age (``float``, *optional*): Maximum age in seconds of files in ``downloads_dir``.
+            Defaults to unlimited.
+        content_addressed (``bool``, *optional*): Name generated files after the hash of their
+            contents so identical outputs share one file. Defaults to False.
+        html_parser (``str``, *optional*): HTML parser used by ``google_search`` and ``hashtag``:
+            ``"selectolax"``, ``"lxml"`` or ``"html.parser"``. Defaults to the fastest installed
+            (``pip install TheApix[fast]`` adds selectolax and lxml).
+
+    Attributes:
+        downloads (:class:`DownloadStore`): Tracks generated files; use it to pin files that are
+            still in use and to read statistics.
     """
 
-    def __init__(self, downloads_dir: str = "downloads", quiet: bool = False):
+    def __init__(
+        self,
+        downloads_dir: str = "downloads",
+        quiet: bool = False,
+        offload: dict[str, str] | None = None,
+        result_cache: ResultCache | None = None,
+        search_cache: SearchCache | None = None,
+        sessions: SessionPool | None = None,
+        max_downloads_size: int | None = None,
+        max_downloads_age: float | None = None,
+        content_addressed: bool = False,
+        html_parser: str | None = None,
+    ):
         self.base_urls = {
             "advice": "https://api.adviceslip.com/advice",
             "btc_value": "https://api.stakdek.de/api/btc/",
@@ -54,8 +126,33 @@ class Client(UploadMedia):
         self.request = Request()
         self.downloads_dir = downloads_dir
         self.quiet = quiet
+        self.offloader = Offloader(offload)
+        self.result_cache = result_cache
+        self.search_cache = search_cache
+        self.sessions = sessions
+        self._stackexchange_backoff = 0.0
+        self._github_etags: OrderedDict[str, tuple[str, tuple, dict]] = OrderedDict()
+        self.html_parser = resolve_parser(html_parser)
+        self.downloads = DownloadStore(
+            downloads_dir,
+            max_size=max_downloads_size,
+            max_age=max_downloads_age,
+            content_addressed=content_addressed,
+        )
+        self._screenshots: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._render_pools: dict[tuple[str, int], ProcessPoolExecutor] = {}
 
-        os.makedirs(self.downloads_dir, exist_ok=True)
+    async def close(self):
+        """
+        Shuts down the worker pools started by :meth:`render_batch`, the offloader and the
+        background collection of :attr:`downloads`.
+        """
+        await self.downloads.stop()
+        pools = list(self._render_pools.values())
+        self._render_pools.clear()
+        for pool in pools:
+            await asyncio.to_thread(pool.shutdown, cancel_futures=True)
+        await asyncio.to_thread(self.offloader.shutdown)
 
     def _handle_error(self, error: Exception) -> dict | Exception:
         if self.quiet:
@@ -65,17 +162,81 @@ class Client(UploadMedia):
     async def _create_file(
         self, contents: bytes, ext: str, name: str | None = None
     ) -> str:
-        file_name = f"{name or 'file'}_{self._rnd_str()}.{ext}"
-        file_path = os.path.join(self.downloads_dir, file_name)
+        return await self.downloads.write(contents, ext=ext, name=name)
+
+    async def _output(
+        self, contents: bytes, ext: str, name: str, output: str = "path"
+    ) -> str | bytes | BytesIO:
+        if output == "bytes":
+            return contents
+        if output == "bytesio":
+            buffer = BytesIO(contents)
+            buffer.name = f"{name}.{ext}"
+            return buffer
+        return await self._create_file(contents, ext=ext, name=name)
+
+    def _output_error(self, output: str) -> ValueError:
+        return ValueError(
+            f"Invalid output '{output}'. Must be one of {', '.join(OUTPUT_MODES)}"
+        )
+
+    async def _cache_get(self, method: str, payload) -> bytes | None:
+        if self.result_cache is None:
+            return None
+        return await self.result_cache.get(method, payload)
+
+    async def _cache_set(self, method: str, payload, contents: bytes):
+        if self.result_cache is not None:
+            await self.result_cache.set(method, payload, contents)
+
+    async def _search_get(self, method: str, query: str, params: dict):
+        if self.search_cache is None:
+            return None
+        return await self.search_cache.get(method, query, params)
+
+    async def _search_set(self, method: str, query: str, params: dict, value):
+        if self.search_cache is not None:
+            await self.search_cache.set(method, query, params, value)
+
+    @asynccontextmanager
+    async def _scrape(
+        self, url: str, params: dict | None = None, timeout: int | None = None
+    ) -> AsyncIterator[Response]:
+        if self.sessions is not None:
+            async with self.sessions.stream(
+                "GET", url, params=params, timeout=timeout
+            ) as response:
+                yield response
+            return
+        headers = {"User-Agent": random.choice(USER_AGENTS)}
+        async with self.request.stream(
+            "GET", url, headers=headers, params=params, timeout=timeout
+        ) as response:
+            yield response
+
+    async def _scrape_get(
+        self, url: str, params: dict | None = None, timeout: int | None = None
+    ) -> Response:
+        async with self._scrape(url, params, timeout) as response:
+            await response.aread()
+            return response
 
-        async with aiofiles.open(file_path, "wb") as f:
-            await f.write(contents)
+    async def preload_assets(self):
+        """
+        Downloads and decodes the template and font used by :meth:`write` ahead of time.
 
-        return file_path
+        Assets are downloaded once per machine and decoded once per process, so calling
+        this on startup removes the network round-trips from the first :meth:`write` call.
 
-    def _rnd_str(self) -> str:
-        random_str = "".join(random.choices(string.ascii_letters + string.digits, k=8))
-        return random_str
+        Example:
+            .. code-block:: python
+
+               api = Client()
+               await api.preload_assets()
+        """
+        await assets.preload(
+            images=[self.base_urls["image"]], fonts={self.base_urls["font"]: [24]}
+        )
 
     async def avatar(self):
         """
@@ -158,9 +319,12 @@ class Client(UploadMedia):
         width_adjustment=True,
         window_controls=True,
         window_theme="none",
+        output="path",
+        backend="remote",
     ):
         """
-        Generate an image of a code snippet using the `Carbonara API <https://github.com/petersolopov/carbonara>`_.
+        Generate an image of a code snippet using the `Carbonara API <https://github.com/petersolopov/carbonara>`_,
+        or render it locally with Pygments and Pillow.
 
 
         Args:
@@ -217,11 +381,18 @@ class Client(UploadMedia):
             width_adjustment (``bool``, *optional*): Automatically adjusts width based on content. Default is ``True``.
             window_controls (``bool``, *optional*): Show or hide window controls (close, minimize, maximize buttons). Default is ``True``.
             window_theme (``str``, *optional*): Style of the window controls. Options: ``"none"``, ``"sharp"``, ``"bw"``, ``"boxy"``. Default is ``"none"``.
+            output (``str``, *optional*): How to return the image: ``"path"`` saves it to ``downloads_dir``, ``"bytes"`` returns the raw PNG bytes and ``"bytesio"`` returns a ``BytesIO``. Default is ``"path"``.
+            backend (``str``, *optional*): ``"remote"`` uses the Carbonara API; ``"local"`` renders the image in-process
+                without any network access (requires ``pip install TheApix[carbon]``). The local renderer maps
+                themes to the closest Pygments style and uses a monospace system font, or ``font_custom`` if given.
+                Default is ``"remote"``.
 
         Returns:
-            A dictionary containing either the file path to the generated image or an error message.
-            If successful, the dictionary will contain **"success": True** and **"result"**: the file path where the generated image is saved.
+            A dictionary containing either the generated image or an error message.
+            If successful, the dictionary will contain **"success": True** and **"result"**: the file path where the generated image is saved (or its bytes / ``BytesIO``, depending on ``output``).
             If failed, the dictionary will contain **"success": False** and **"error"**: a string describing the error that occurred.
+            An invalid ``output`` or ``backend`` raises ``ValueError`` (or returns an error dict when the client is ``quiet``),
+            as in every other method.
 
         Example:
 
@@ -251,6 +422,12 @@ class Client(UploadMedia):
 
                 Code image saved as 'downloads/carbon_Z6b6oUv7.png'.
         """
+        if output not in OUTPUT_MODES:
+            return self._handle_error(self._output_error(output))
+        if backend not in ("remote", "local"):
+            return self._handle_error(
+                ValueError(f"Invalid backend '{backend}'. Must be one of remote, local")
+            )
 
         payload = {
             "code": code,
@@ -278,13 +455,24 @@ class Client(UploadMedia):
             "windowTheme": window_theme,
         }
         try:
-            response = await self.request.post(self.base_urls["carbon"], json=payload)
-            response.raise_for_status()
-            file_path = await self._create_file(
-                response.content, ext="png", name="carbon"
+            if backend == "local":
+                contents = await self.offloader.run(
+                    "carbon", render_code, code, payload
+                )
+            else:
+                contents = await self._cache_get("carbon", payload)
+            if contents is None:
+                response = await self.request.post(
+                    self.base_urls["carbon"], json=payload
+                )
+                response.raise_for_status()
+                contents = response.content
+                await self._cache_set("carbon", payload, contents)
+            result = await self._output(
+                contents, ext="png", name="carbon", output=output
             )
 
-            return {"success": True, "result": file_path}
+            return {"success": True, "result": result}
         except Exception as e:
             return {"success": False, "error": str(e)}
 
@@ -743,20 +931,24 @@ class Client(UploadMedia):
         self,
         source: str,
         from_url: bool = True,
-    ) -> str:
+        output: str = "path",
+    ) -> str | bytes | BytesIO:
         """
         Generates a PDF from a URL or an HTML string and saves it to a file.
 
         Args:
             source (``str``): The URL of the website (if `from_url=True`) or the HTML string (if `from_url=False`).
             from_url (``bool``, *optional"): Whether to generate the PDF from a URL (True) or an HTML string (False).
+            output (``str``, *optional*): ``"path"``, ``"bytes"`` or ``"bytesio"`` (default: ``"path"``).
 
         Returns:
-            ``str``: The file path where the PDF was saved.
+            ``str``: The file path where the PDF was saved, or the PDF as ``bytes`` / ``BytesIO`` depending on ``output``.
 
         Raises:
-            ValueError: If `from_url` is True and `source` is not a valid URL.
+            ValueError: If `from_url` is True and `source` is not a valid URL, or `output` is invalid.
         """
+        if output not in OUTPUT_MODES:
+            return self._handle_error(self._output_error(output))
         if from_url:
             # Validate the URL format using regex
             url_regex = re.compile(
@@ -772,11 +964,15 @@ class Client(UploadMedia):
         url = url + "/from_url" if from_url else url + "/from_html"
         params = {"url": source} if from_url else {"html": source}
 
-        response = await self.request.get(url, params=params)
-        pdf_content = response.read()
-        file_path = await self._create_file(pdf_content, ext="pdf", name="pdf")
-
-        return file_path
+        pdf_content = (
+            None if from_url else await self._cache_get("generate_pdf", params)
+        )
+        if pdf_content is None:
+            response = await self.request.get(url, params=params)
+            pdf_content = response.read()
+            if not from_url and response.is_success:
+                await self._cache_set("generate_pdf", params, pdf_content)
+        return await self._output(pdf_content, ext="pdf", name="pdf", output=output)
 
     async def gen_qr(
         self,
@@ -784,19 +980,51 @@ class Client(UploadMedia):
         size: str = "150x150",
         foreground_color: str = "000000",
         background_color: str = "FFFFFF",
-    ) -> str:
+        output: str = "path",
+        backend: str = "remote",
+        error_correction: str = "L",
+    ) -> str | bytes | BytesIO:
         """
-        Generate a QR code using api.qrserver.com and save it as a PNG file.
+        Generate a QR code using api.qrserver.com, or the built-in encoder, and save it as a PNG file.
 
         Args:
             data (``str``): The content for the QR code.
             size (``str``, *optional*): The size of the QR code in the format 'WIDTHxHEIGHT' (default: '150x150').
             foreground_color (``str``, *optional*): The color of the QR code (default: '000000' - black).
             background_color (``str``, *optional*): The background color of the QR code (default: 'FFFFFF' - white).
+            output (``str``, *optional*): ``"path"``, ``"bytes"`` or ``"bytesio"`` (default: ``"path"``).
+            backend (``str``, *optional*): ``"remote"`` uses api.qrserver.com; ``"local"`` encodes the QR code
+                in-process with no network round-trip (default: ``"remote"``).
+            error_correction (``str``, *optional*): Error correction level ``"L"``, ``"M"``, ``"Q"`` or ``"H"``
+                (default: ``"L"``).
 
         Returns:
-            str: The file path where the QR code was saved.
+            str: The file path where the QR code was saved, or the PNG as ``bytes`` / ``BytesIO`` depending on ``output``.
         """
+        if output not in OUTPUT_MODES:
+            return self._handle_error(self._output_error(output))
+        if backend not in ("remote", "local"):
+            return self._handle_error(
+                ValueError(f"Invalid backend '{backend}'. Must be one of remote, local")
+            )
+        if error_correction.upper() not in ERROR_CORRECTION:
+            return self._handle_error(
+                ValueError(
+                    f"Invalid error correction level '{error_correction}'. Must be one of {', '.join(ERROR_CORRECTION)}"
+                )
+            )
+
+        if backend == "local":
+            contents = await self.offloader.run(
+                "gen_qr",
+                render_qr,
+                data,
+                size,
+                foreground_color,
+                background_color,
+                error_correction,
+            )
+            return await self._output(contents, ext="png", name="QrCode", output=output)
 
         url = f"{self.base_urls['qr_gen']}/create-qr-code/"
         params = {
@@ -804,11 +1032,15 @@ class Client(UploadMedia):
             "data": data,
             "color": foreground_color,
             "bgcolor": background_color,
+            "ecc": error_correction.upper(),
         }
-        response = await self.request.get(url=url, params=params)
-        file_path = await self._create_file(response.content, ext="png", name="QrCode")
-
-        return file_path
+        contents = await self._cache_get("gen_qr", params)
+        if contents is None:
+            response = await self.request.get(url=url, params=params)
+            contents = response.content
+            if response.is_success:
+                await self._cache_set("gen_qr", params, contents)
+        return await self._output(contents, ext="png", name="QrCode", output=output)
 
     async def get_uselessfact(self):
         """
@@ -829,12 +1061,14 @@ class Client(UploadMedia):
         timeout: int = 5,
         adlt: str = "active",
         region: str = None,
+        concurrency: int = 4,
     ) -> dict:
         """
          Perform an asynchronous search on Google and return a list of results.
 
-         This method sends an HTTP request to Google with the specified query and retrieves the search results.
-         The results are then returned in a dictionary format containing the URLs, titles, and descriptions.
+         This method sends HTTP requests to Google with the specified query and retrieves the search results.
+         The result pages needed for ``limit`` are fetched concurrently, and the results are returned in
+         rank order in a dictionary format containing the URLs, titles, and descriptions.
 
          Args:
              query (str): The search query (e.g., "Python programming").
@@ -843,6 +1077,7 @@ class Client(UploadMedia):
              timeout (int, optional): The time to wait for a response in seconds. Defaults to 5.
              adlt (str, optional): The safe search setting. Can be "active" or "off". Defaults to "active".
              region (str, optional): The region to filter search results. Defaults to None.
+             concurrency (int, optional): The maximum number of result pages fetched at once. Defaults to 4.
 
 
         Returns:
@@ -851,66 +1086,116 @@ class Client(UploadMedia):
                  If failed, the dictionary will contain **"success": False** and **"error"**: a string describing the error that occurred.
 
         """
-        _useragent_list = [
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:66.0) Gecko/20100101 Firefox/66.0",
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/111.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/111.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/109.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/111.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/111.0.0.0 Safari/537.36 Edg/111.0.1661.62",
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) Gecko/20100101 Firefox/111.0",
-        ]
-        start, fetched_results, fetched_links = 0, 0, set()
-        all_results = []
+        try:
+            results = [
+                result
+                async for result in self.iter_google_search(
+                    query, limit, lang, timeout, adlt, region, concurrency
+                )
+            ]
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+        return {"success": True, "result": results}
+
+    async def iter_google_search(
+        self,
+        query: str,
+        limit: int = 10,
+        lang: str = "en",
+        timeout: int = 5,
+        adlt: str = "active",
+        region: str = None,
+        concurrency: int = 4,
+    ) -> AsyncIterator[dict]:
+        """
+        Yields Google search results in rank order as each result page is parsed.
+
+        Takes the same arguments as :meth:`google_search`. The pages needed to reach ``limit``
+        are requested concurrently, at most ``concurrency`` at a time, so the first results arrive
+        after a single round-trip. Links already yielded from an earlier page are skipped.
+
+        Yields:
+            ``dict``: ``{"url", "title", "desc"}`` for each result.
 
-        while fetched_results < limit:
+        Raises:
+            httpx.HTTPError: If a result page cannot be fetched.
+
+        Example:
+            .. code-block:: python
+
+               async for result in api.iter_google_search("Python programming", limit=50):
+                   print(result["title"], result["url"])
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(page: int) -> tuple[list[dict], bool]:
             params = {
                 "q": query,
-                "num": limit + 2,
+                "num": GOOGLE_PAGE_SIZE,
                 "hl": lang,
-                "start": start,
+                "start": page * GOOGLE_PAGE_SIZE,
                 "safe": adlt,
                 "gl": region,
             }
-            headers = {"User-Agent": random.choice(_useragent_list)}
-
-            try:
-                resp = await self.request.get(
-                    "https://www.google.com/search",
-                    params=params,
-                    headers=headers,
-                    timeout=timeout,
+            async with semaphore:
+                resp = await self._scrape_get(
+                    "https://www.google.com/search", params=params, timeout=timeout
                 )
-                resp.raise_for_status()
-            except Exception as e:
-                return {"success": False, "error": str(e)}
-            soup = BeautifulSoup(resp.text, "html.parser")
-
-            for result in soup.find_all("div", class_="g"):
-                link_tag, title_tag = result.find("a", href=True), result.find("h3")
-                description_box = result.find("div", {"style": "-webkit-line-clamp:2"})
-                if not (link_tag and title_tag and description_box):
-                    continue
-
-                link = link_tag["href"]
-                if link in fetched_links:
-                    continue
-                fetched_links.add(link)
-
-                fetched_results += 1
-                all_results.append(
-                    {"url": link, "title": title_tag.text, "desc": description_box.text}
-                )
-
-                if fetched_results >= limit:
-                    return {"success": True, "result": all_results}
-
-            if not soup.find_all("div", class_="g"):
-                break
-
-            start += 10
+            resp.raise_for_status()
+            return await self.offloader.run(
+                "google_search", parse_google_results, resp.text, self.html_parser
+            )
 
-        return {"success": True, "result": all_results}
+        search_params = {"lang": lang, "adlt": adlt, "region": region}
+        cached = await self._search_get("google_search", query, search_params)
+        # Every result on the pages before ``page``, deduplicated in rank order.
+        results = cached["results"] if cached else []
+        page = first_page = cached["page"] if cached else 0
+        exhausted = cached["exhausted"] if cached else False
+
+        for result in results[:limit]:
+            yield result
+        if len(results) >= limit or exhausted:
+            return
+
+        pages: dict[int, asyncio.Future] = {}
+        next_page, yielded = page, len(results)
+        fetched_links = {result["url"] for result in results}
+        try:
+            while len(results) < limit:
+                # Keep enough pages in flight to cover the results still missing.
+                needed = page - (-(limit - len(results)) // GOOGLE_PAGE_SIZE)
+                while next_page < needed:
+                    pages[next_page] = asyncio.ensure_future(fetch(next_page))
+                    next_page += 1
+
+                page_results, has_blocks = await pages.pop(page)
+                new_results = []
+                for result in page_results:
+                    if result["url"] not in fetched_links:
+                        fetched_links.add(result["url"])
+                        new_results.append(result)
+                # The whole page is recorded before any of it is yielded, so a consumer
+                # that stops early still leaves complete pages for the cache.
+                results.extend(new_results)
+                page += 1
+                for result in new_results[: limit - yielded]:
+                    yielded += 1
+                    yield result
+
+                if not has_blocks:
+                    exhausted = True
+                    break
+        finally:
+            for task in pages.values():
+                task.cancel()
+            if page > first_page:
+                await self._search_set(
+                    "google_search",
+                    query,
+                    search_params,
+                    {"results": results, "page": page, "exhausted": exhausted},
+                )
 
     async def get_truth(self, rating: str = None) -> dict:
         """
@@ -1014,21 +1299,22 @@ class Client(UploadMedia):
                >>> await api.hashtag('python', 'IN')
                ['#pythonindia', '#codingindia', '#programmingindia', '#developerindia']
         """
+        cached = await self._search_get("hashtag", query, {"country": country})
+        if cached is not None:
+            return cached
+
         if country:
-            page = await self.request.get(
+            page = await self._scrape_get(
                 f"https://www.tagsfinder.com/en-{country}/related/{query}/"
             )
-            soup = BeautifulSoup(page.content, "html.parser")
-            hashtags = soup.find(id="hashtagy").get_text()
-            if hashtags:
-                hashtags = hashtags.strip().split(" ")
         else:
-            page = await self.requests.get(f"http://best-hashtags.com/hashtag/{query}/")
-            soup = BeautifulSoup(page.content, "html.parser")
-            hashtags = soup.find("p1").get_text()
-            if hashtags:
-                hashtags = hashtags.strip().split(" ")
+            page = await self._scrape_get(f"http://best-hashtags.com/hashtag/{query}/")
 
+        hashtags = await self.offloader.run(
+            "hashtag", parse_hashtags, page.content, bool(country), self.html_parser
+        )
+        if hashtags:
+            await self._search_set("hashtag", query, {"country": country}, hashtags)
         return hashtags
 
     async def quote(self) -> str:
@@ -1063,7 +1349,7 @@ class Client(UploadMedia):
         response = response.json()
         return response["quote"]
 
-    async def write(self, text):
+    async def write(self, text, output="path"):
         """
         Creates an image with text written on it, using a predefined template and font,
         and uploads the image after generation.
@@ -1071,48 +1357,107 @@ class Client(UploadMedia):
         Args:
             text (``str``): The text to be written on the image. Text exceeding 55 characters
                         per line will be wrapped, with up to 25 lines displayed.
+            output (``str``, *optional*): ``"path"``, ``"bytes"`` or ``"bytesio"``. Defaults to ``"path"``.
 
         Returns:
-            ``str``: The URL of the uploaded image.
+            ``str``: The file path of the generated image, or the JPEG as ``bytes`` / ``BytesIO`` depending on ``output``.
 
         """
-        tryimg = "https://graph.org/file/1f8d00177ac2429b101b9.jpg"
-        tryresp = await self.request.get(tryimg)
-        img = Image.open(BytesIO(tryresp.content))
-        draw = ImageDraw.Draw(img)
+        if output not in OUTPUT_MODES:
+            return self._handle_error(self._output_error(output))
+        template_path = await assets.get_path(self.base_urls["image"])
+        font_path = await assets.get_path(self.base_urls["font"])
+        contents = await self.offloader.run(
+            "write", render_write, text, template_path, font_path
+        )
+        return await self._output(contents, ext="jpg", name="write", output=output)
 
-        font_url = "https://github.com/google/fonts/raw/main/ofl/poetsenone/PoetsenOne-Regular.ttf"
-        font_response = await self.request.get(font_url)
-        font = ImageFont.truetype(BytesIO(font_response.content), 24)
+    async def render_batch(
+        self,
+        method: str,
+        jobs: list[str | dict],
+        output: str = "path",
+        max_workers: int | None = None,
+    ) -> list[str | bytes]:
+        """
+        Renders many :meth:`blackpink` or :meth:`write` images in parallel across CPU cores.
 
-        x, y = 150, 140
-        lines = []
-        if len(text) <= 55:
-            lines.append(text)
-        else:
-            all_lines = text.split("\n")
-            for line in all_lines:
-                if len(line) <= 55:
-                    lines.append(line)
-                else:
-                    k = len(line) // 55
-                    lines.extend(
-                        line[((z - 1) * 55) : (z * 55)] for z in range(1, k + 2)
-                    )
+        Jobs are spread over a process pool sized to the core count. The pool is kept for later
+        calls until :meth:`close`, each worker loads the fonts and templates once on startup, and
+        results come back in input order. If a job fails, the jobs that have not started are
+        cancelled and the error is handled like any other.
 
-        umm = lines[:25]
+        Args:
+            method (``str``): The renderer to use, ``"blackpink"`` or ``"write"``.
+            jobs (``list``): One entry per image. Either the text to render, or a dict of the
+                keyword arguments the method accepts (``{"query": ..., "color": ..., "border_color": ...}``
+                for ``blackpink``, ``{"text": ...}`` for ``write``).
+            output (``str``, *optional*): ``"path"`` to save each image to ``downloads_dir`` and return
+                its path, ``"bytes"`` to return the encoded JPEG bytes or ``"bytesio"`` for ``BytesIO``
+                objects. Defaults to ``"path"``.
+            max_workers (``int``, *optional*): Number of worker processes. Defaults to ``os.cpu_count()``.
 
-        font.getbbox("hg")[3]
-        linespacing = 41
-        for line in umm:
-            draw.text((x, y), line, fill=(1, 22, 55), font=font)
-            y = y + linespacing
+        Returns:
+            ``list``: File paths or bytes, in the same order as ``jobs``.
 
-        file_path = os.path.join(self.downloads_dir, f"write_{self._rnd_str()}.jpg")
+        Example:
+            .. code-block:: python
 
-        img.save(file_path)
+               paths = await api.render_batch("blackpink", ["Jennie", "Lisa", {"query": "Rosé", "color": "#ffffff"}])
+               print(paths)
+        """
+        if method not in ("blackpink", "write"):
+            return self._handle_error(
+                ValueError(
+                    f"Invalid method '{method}'. Must be one of blackpink, write"
+                )
+            )
+        if output not in OUTPUT_MODES:
+            return self._handle_error(self._output_error(output))
+
+        images, fonts = [], {}
+        if method == "blackpink":
+            func = render_blackpink
+            tasks = []
+            for job in jobs:
+                if isinstance(job, str):
+                    job = {"query": job}
+                tasks.append(
+                    (job["query"], job.get("color", "#ff94e0"), job.get("border_color"))
+                )
+        else:
+            func = render_write
+            template_path = await assets.get_path(self.base_urls["image"])
+            font_path = await assets.get_path(self.base_urls["font"])
+            images, fonts = [template_path], {font_path: [24]}
+            tasks = [
+                (job if isinstance(job, str) else job["text"], template_path, font_path)
+                for job in jobs
+            ]
+
+        key = (method, max_workers or os.cpu_count())
+        pool = self._render_pools.get(key)
+        if pool is None:
+            pool = self._render_pools[key] = ProcessPoolExecutor(
+                max_workers=key[1], initializer=init_worker, initargs=(images, fonts)
+            )
 
-        return file_path
+        loop = asyncio.get_running_loop()
+        futures = [loop.run_in_executor(pool, func, *args) for args in tasks]
+        try:
+            results = await asyncio.gather(*futures)
+        except Exception as error:
+            for future in futures:
+                future.cancel()
+            if isinstance(error, BrokenProcessPool):
+                self._render_pools.pop(key, None)
+                await asyncio.to_thread(pool.shutdown, cancel_futures=True)
+            return self._handle_error(error)
+
+        return [
+            await self._output(contents, ext="jpg", name=method, output=output)
+            for contents in results
+        ]
 
     async def wikipedia(self, query):
         """
@@ -1190,112 +1535,126 @@ class Client(UploadMedia):
         Returns:
             ``list``: A list of search results or an error message.
         """
-        valid_search_types = [
-            "repositories",
-            "users",
-            "organizations",
-            "issues",
-            "pull_requests",
-            "commits",
-            "topics",
-        ]
-
-        if search_type not in valid_search_types:
+        if search_type not in SEARCH_TYPES:
             return {
-                "error": f"Invalid search type. Valid types are: {valid_search_types}"
+                "error": f"Invalid search type. Valid types are: {list(SEARCH_TYPES)}"
             }
 
-        url_mapping = {
-            "pull_requests": "https://api.github.com/search/issues",
-            "organizations": "https://api.github.com/search/users",
-            "topics": "https://api.github.com/search/topics",
-        }
-
-        if search_type in url_mapping:
-            url = url_mapping[search_type]
-            if search_type == "pull_requests":
-                query += " type:pr"
-            elif search_type == "organizations":
-                query += " type:org"
-        else:
-            url = f"https://api.github.com/search/{search_type}"
+        try:
+            return [
+                record._asdict()
+                async for record in self.iter_github_search(
+                    query, search_type, max_results
+                )
+            ]
+        except Exception as e:
+            return self._handle_error(ValueError(f"Unexpected error: {e}"))
 
+    async def _github_page(self, search_type: str, url: str) -> tuple[tuple, dict]:
         headers = {"Accept": "application/vnd.github.v3+json"}
-        params = {"q": query, "per_page": max_results}
+        cached = self._github_etags.get(url)
+        if cached:
+            headers["If-None-Match"] = cached[0]
 
-        try:
-            response = await self.request.get(url, headers=headers, params=params)
-            response = response.json()
-            items = response.get("items", [])
-
-            result_list = []
-
-            for item in items:
-                item_info = {}
-                if search_type == "repositories":
-                    item_info = {
-                        "name": item["name"],
-                        "full_name": item["full_name"],
-                        "description": item["description"],
-                        "url": item["html_url"],
-                        "language": item.get("language"),
-                        "stargazers_count": item.get("stargazers_count"),
-                        "forks_count": item.get("forks_count"),
-                    }
-                elif search_type in ["users", "organizations"]:
-                    item_info = {
-                        "login": item["login"],
-                        "id": item["id"],
-                        "url": item["html_url"],
-                        "avatar_url": item.get("avatar_url"),
-                        "type": item.get("type"),
-                        "site_admin": item.get("site_admin"),
-                        "name": item.get("name"),
-                        "company": item.get("company"),
-                        "blog": item.get("blog"),
-                        "location": item.get("location"),
-                        "email": item.get("email"),
-                        "bio": item.get("bio"),
-                        "public_repos": item.get("public_repos"),
-                        "public_gists": item.get("public_gists"),
-                        "followers": item.get("followers"),
-                        "following": item.get("following"),
-                    }
-                elif search_type in ["issues", "pull_requests"]:
-                    item_info = {
-                        "title": item["title"],
-                        "user": item["user"]["login"],
-                        "state": item["state"],
-                        "url": item["html_url"],
-                        "comments": item.get("comments"),
-                        "created_at": item.get("created_at"),
-                        "updated_at": item.get("updated_at"),
-                        "closed_at": item.get("closed_at"),
-                    }
-                elif search_type == "commits":
-                    item_info = {
-                        "sha": item["sha"],
-                        "commit_message": item["commit"]["message"],
-                        "author": item["commit"]["author"]["name"],
-                        "date": item["commit"]["author"]["date"],
-                        "url": item["html_url"],
-                    }
-                elif search_type == "topics":
-                    item_info = {
-                        "name": item["name"],
-                        "display_name": item.get("display_name"),
-                        "short_description": item.get("short_description"),
-                        "description": item.get("description"),
-                        "created_by": item.get("created_by"),
-                        "url": item.get("url") if "url" in item else None,
-                    }
+        response = await self.request.get(url, headers=headers)
+        if response.status_code == 304 and cached:
+            self._github_etags.move_to_end(url)
+            return cached[1], cached[2]
 
-                result_list.append(item_info)
+        data = response.json()
+        if response.is_error:
+            raise ValueError(data.get("message", f"HTTP {response.status_code}"))
+
+        project = PROJECTIONS[search_type]
+        records = tuple(project(item) for item in data.get("items", []))
+        links = response.links
+        etag = response.headers.get("etag")
+        if etag:
+            self._github_etags[url] = (etag, records, links)
+            self._github_etags.move_to_end(url)
+            while len(self._github_etags) > GITHUB_ETAG_CACHE_SIZE:
+                self._github_etags.popitem(last=False)
+        return records, links
+
+    async def iter_github_search(
+        self,
+        query: str,
+        search_type: str = "repositories",
+        max_results: int = 30,
+        prefetch: int = 2,
+    ) -> AsyncIterator[NamedTuple]:
+        """
+        Yields GitHub search results as compact records, following the ``Link`` headers across pages.
 
-            return result_list
+        Pages are fetched lazily: while one page is consumed, at most ``prefetch`` following pages are
+        requested. Each page is requested with the ``ETag`` of its previous response, so repeating a
+        query answers from memory on ``304 Not Modified``, which GitHub does not count against the
+        rate limit.
 
-        except Exception as e:
-            return self._handle_error(ValueError(f"Unexpected error: {e}"))
+        Args:
+            query (``str``): The search query.
+            search_type (``str``, *optional*): One of the types accepted by :meth:`github_search`.
+                Defaults to "repositories".
+            max_results (``int``, *optional*): The maximum number of results to yield. Defaults to 30.
+            prefetch (``int``, *optional*): Pages requested ahead of the consumer. Defaults to 2.
+
+        Yields:
+            ``NamedTuple``: A ``Repository``, ``Account``, ``Issue``, ``Commit`` or ``Topic`` record
+            with the same fields as the dicts returned by :meth:`github_search`.
+
+        Raises:
+            ValueError: If ``search_type`` is invalid or GitHub returns an error.
+
+        Example:
+            .. code-block:: python
+
+               async for repo in api.iter_github_search("language:python stars:>1000", max_results=300):
+                   print(repo.full_name, repo.stargazers_count)
+        """
+        if search_type not in SEARCH_TYPES:
+            raise ValueError(
+                f"Invalid search type. Valid types are: {list(SEARCH_TYPES)}"
+            )
+        if max_results <= 0:
+            return
+
+        url, query = search_endpoint(search_type, query)
+        per_page = min(max_results, MAX_PER_PAGE)
+        first_url = str(URL(url, params={"q": query, "per_page": per_page}))
+
+        records, links = await self._github_page(search_type, first_url)
+        urls = page_urls(links, -(-max_results // per_page))
+        queue: deque[asyncio.Future] = deque()
+        count = 0
+        try:
+            while True:
+                if urls is None:
+                    # No page numbers in the links: follow ``next`` one page at a time.
+                    if "next" in links and not queue:
+                        queue.append(
+                            asyncio.ensure_future(
+                                self._github_page(search_type, links["next"]["url"])
+                            )
+                        )
+                else:
+                    while urls and len(queue) < prefetch:
+                        queue.append(
+                            asyncio.ensure_future(
+                                self._github_page(search_type, urls.pop(0))
+                            )
+                        )
+
+                for record in records:
+                    yield record
+                    count += 1
+                    if count >= max_results:
+                        return
+                if not records or not queue:
+                    return
+                records, links = await queue.popleft()
+        finally:
+            for task in queue:
+                task.cancel()
 
     async def get_words(self, limit=10, length=None, letter=None, alphabetize=False):
         """
@@ -1459,10 +1818,16 @@ class Client(UploadMedia):
         response = response.json()
         return response["link"]
 
-    async def bing_image(self, query: str, limit: int = 3, adlt: str = "moderate"):
+    async def bing_image(
+        self, query: str, limit: int = 3, adlt: str = "moderate", concurrency: int = 4
+    ):
         """
         Searches Bing for images based on a query and retrieves image URLs.
 
+        Result pages are requested concurrently and scanned as they stream in, until ``limit``
+        unique URLs are found or Bing runs out of new results. If Bing answers a page with an
+        error, the URLs found before it are returned.
+
         Args:
             query (``str``): The search query string for finding images.
             limit (``int``, *optional*): The maximum number of image URLs to return. Defaults to 3.
@@ -1471,6 +1836,7 @@ class Client(UploadMedia):
                 "off", which disables filtering for adult content.
                 "moderate" (default), which filters explicit images but may include related content.
                 "strict", which enforces strict filtering, excluding all adult content.
+            concurrency (``int``, *optional*): The maximum number of result pages fetched at once. Defaults to 4.
 
         Returns:
             ``list``: A list of image URLs retrieved from the Bing search results.
@@ -1493,28 +1859,100 @@ class Client(UploadMedia):
                 ]
         """
 
-        data = {
-            "q": query,
-            "first": 0,
-            "count": limit,
-            "adlt": adlt,
-            "qft": "",
-        }
-        response = await self.request.get(self.base_urls["bing_image"], params=data)
-        return (
-            re.findall(r"murl&quot;:&quot;(.*?)&quot;", response.text)
-            if response
-            else []
-        )
+        cached = await self._search_get("bing_image", query, {"adlt": adlt})
+        images = cached["images"] if cached else []
+        offset = cached["next"] if cached else 0
+        if len(images) >= limit or (cached and cached["exhausted"]):
+            return images[:limit]
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(first: int) -> list[str] | None:
+            data = {
+                "q": query,
+                "first": first,
+                "count": BING_PAGE_SIZE,
+                "adlt": adlt,
+                "qft": "",
+            }
+            async with semaphore:
+                async with self._scrape(
+                    self.base_urls["bing_image"], params=data
+                ) as response:
+                    if response.is_error:
+                        return None
+                    return [
+                        url
+                        async for url in iter_matches(
+                            response.aiter_text(), BING_IMAGE_PATTERN, BING_IMAGE_START
+                        )
+                    ]
+
+        # Only the pages past the cached results are requested.
+        pages: dict[int, asyncio.Future] = {}
+        page = next_page = 0
+        exhausted, seen = False, set(images)
+        try:
+            while len(images) < limit:
+                needed = page - (-(limit - len(images)) // BING_PAGE_SIZE)
+                while next_page < needed:
+                    pages[next_page] = asyncio.ensure_future(
+                        fetch(offset + next_page * BING_PAGE_SIZE)
+                    )
+                    next_page += 1
+
+                found = await pages.pop(page)
+                if found is None:
+                    # A failed page is neither exhaustion nor a page to skip next time.
+                    break
+                page += 1
+                new = 0
+                for url in found:
+                    if url not in seen:
+                        seen.add(url)
+                        images.append(url)
+                        new += 1
+                if not new:
+                    exhausted = True
+                    break
+        finally:
+            for task in pages.values():
+                task.cancel()
+
+        if page:
+            await self._search_set(
+                "bing_image",
+                query,
+                {"adlt": adlt},
+                {
+                    "images": images,
+                    "next": offset + page * BING_PAGE_SIZE,
+                    "exhausted": exhausted,
+                },
+            )
+        return images[:limit]
 
-    async def stackoverflow_search(self, query, max_results=3, sort_type="relevance"):
+    async def stackoverflow_search(
+        self,
+        query,
+        max_results=3,
+        sort_type="relevance",
+        filter=None,
+        concurrency=4,
+    ):
         """
         Searches Stack Overflow for questions based on a query, returning results sorted by relevance or another specified criteria.
 
+        Pages of up to 100 questions are requested, as many as ``max_results`` needs, and fetched concurrently.
+
         Args:
             query (str): The search query string.
             max_results (int, optional): The maximum number of results to return. Defaults to 3.
             sort_type (str, optional): The sorting criteria for the results, such as "relevance" or "votes". Defaults to "relevance".
+            filter (str, optional): A StackExchange `filter <https://api.stackexchange.com/docs/filters>`_ selecting the
+                fields returned, which shrinks the payload. It must keep ``.items`` and ``.has_more`` in the wrapper.
+                Defaults to the API's default fields.
+            concurrency (int, optional): The maximum number of pages fetched at once. Defaults to 4.
 
         Returns:
             list: A list of search results in JSON format, with each entry containing Stack Overflow question details.
@@ -1522,33 +1960,91 @@ class Client(UploadMedia):
         Raises:
             ValueError: If there is an issue with the request to the Stack Overflow API.
         """
+        return [
+            item
+            async for item in self.iter_stackoverflow_search(
+                query, max_results, sort_type, filter, concurrency
+            )
+        ]
 
-        url = "https://api.stackexchange.com/2.3/search/advanced"
-        params = {
-            "order": "desc",
-            "sort": sort_type,
-            "q": query,
-            "site": "stackoverflow",
-            "page": 1,
-        }
+    async def iter_stackoverflow_search(
+        self,
+        query: str,
+        max_results: int = 3,
+        sort_type: str = "relevance",
+        filter: str | None = None,
+        concurrency: int = 4,
+    ) -> AsyncIterator[dict]:
+        """
+        Yields Stack Overflow search results in order as their pages arrive.
 
-        all_results = []
-        while len(all_results) < max_results:
-            response = await self.request.get(url, params=params)
-            response = response.json()
-            results = response.get("items", [])
-            if not results:
-                break
+        Takes the same arguments as :meth:`stackoverflow_search`. The pages needed for ``max_results``
+        are requested up front with at most ``concurrency`` in flight, and any ``backoff`` the API asks
+        for is honoured before the next request.
 
-            all_results.extend(results)
-            if len(results) < 30:
-                break
+        Yields:
+            ``dict``: One question per item.
 
-            params["page"] += 1
+        Raises:
+            ValueError: If the API returns an error.
 
-        return all_results[:max_results]
+        Example:
+            .. code-block:: python
 
-    async def blackpink(self, query, color="#ff94e0", border_color=None):
+               async for question in api.iter_stackoverflow_search("asyncio", max_results=250, filter="!nNPvSNdWme"):
+                   print(question["title"])
+        """
+        url = "https://api.stackexchange.com/2.3/search/advanced"
+        pagesize = max(1, min(max_results, STACKEXCHANGE_PAGE_SIZE))
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(page: int) -> dict:
+            params = {
+                "order": "desc",
+                "sort": sort_type,
+                "q": query,
+                "site": "stackoverflow",
+                "page": page,
+                "pagesize": pagesize,
+            }
+            if filter:
+                params["filter"] = filter
+            async with semaphore:
+                delay = self._stackexchange_backoff - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                response = await self.request.get(url, params=params)
+            data = response.json()
+            if "error_id" in data:
+                raise ValueError(
+                    f"Stack Exchange API error {data['error_id']}: {data.get('error_message')}"
+                )
+            if data.get("backoff"):
+                self._stackexchange_backoff = max(
+                    self._stackexchange_backoff, time.monotonic() + data["backoff"]
+                )
+            return data
+
+        pages = [
+            asyncio.ensure_future(fetch(page))
+            for page in range(1, -(-max_results // pagesize) + 1)
+        ]
+        count = 0
+        try:
+            for page in pages:
+                data = await page
+                for item in data.get("items", []):
+                    yield item
+                    count += 1
+                    if count >= max_results:
+                        return
+                if not data.get("has_more"):
+                    return
+        finally:
+            for page in pages:
+                page.cancel()
+
+    async def blackpink(self, query, color="#ff94e0", border_color=None, output="path"):
         """
         Creates a stylized "Blackpink"-themed image with custom text, color, and optional border.
 
@@ -1561,86 +2057,30 @@ class Client(UploadMedia):
             border_color (``str``, *optional*):
                 The color of the image border in hex format.
                 If not provided, defaults to the value of ``color``.
+            output (``str``, *optional*):
+                ``"path"``, ``"bytes"`` or ``"bytesio"``. Defaults to ``"path"``.
 
         Returns:
             ``str``:
-                The file path of the generated image.
+                The file path of the generated image, or the JPEG as ``bytes`` / ``BytesIO``
+                depending on ``output``.
         """
+        if output not in OUTPUT_MODES:
+            return self._handle_error(self._output_error(output))
 
-        text = query
-        font_path = "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf"
-        initial_font_size = 100
-
-        img_width = 800
-        img_height = 600
-
-        dummy_img = Image.new("RGB", (1, 1))
-        draw_dummy = ImageDraw.Draw(dummy_img)
-
-        font_size = initial_font_size
-        padding = 50
-        max_width = img_width - 2 * padding
-        max_height = img_height - 2 * padding
-
-        font = ImageFont.truetype(font_path, font_size)
-        lines = textwrap.wrap(text, width=40)
-
-        while True:
-            text_height = sum(
-                draw_dummy.textbbox((0, 0), line, font=font)[3]
-                - draw_dummy.textbbox((0, 0), line, font=font)[1]
-                for line in lines
-            )
-            if text_height <= max_height and all(
-                draw_dummy.textbbox((0, 0), line, font=font)[2] <= max_width
-                for line in lines
-            ):
-                break
-            font_size -= 1
-            font = ImageFont.truetype(font_path, font_size)
-            lines = textwrap.wrap(text, width=40)
-
-        gradient = Image.new("RGB", (img_width, img_height), color)
-        for i in range(img_height):
-            r = int(255 - (255 - int(color[1:3], 16)) * (i / img_height))
-            g = int(148 - (148 - int(color[3:5], 16)) * (i / img_height))
-            b = int(224 - (224 - int(color[5:7], 16)) * (i / img_height))
-            ImageDraw.Draw(gradient).line([(0, i), (img_width, i)], fill=(r, g, b))
-
-        img = Image.new("RGB", (img_width, img_height), (0, 0, 0))
-        draw = ImageDraw.Draw(img)
-
-        y_text = (img_height - text_height) // 2
-        for line in lines:
-            bbox = draw.textbbox((0, 0), line, font=font)
-            line_width = bbox[2] - bbox[0]
-            line_height = bbox[3] - bbox[1]
-            draw.text(
-                ((img_width - line_width) // 2, y_text),
-                line,
-                fill=color,
-                font=font,
-                align="center",
-            )
-            y_text += line_height
-
-        border_color = border_color or color
-        border_width = 28
-        img_with_border = ImageOps.expand(img, border=border_width, fill=border_color)
-
-        final_img = Image.new(
-            "RGB", (img_with_border.width, img_with_border.height), (0, 0, 0)
+        contents = await self.offloader.run(
+            "blackpink", render_blackpink, query, color, border_color
         )
-        final_img.paste(gradient, (0, 0))
-        final_img.paste(img_with_border, (0, 0))
-
-        file_path = os.path.join(self.downloads_dir, f"blackpink_{self._rnd_str()}.jpg")
+        return await self._output(contents, ext="jpg", name="blackpink", output=output)
 
-        final_img.save(file_path, format="JPEG")
-
-        return file_path
-
-    async def upload_image(self, file_path: str | bytes | BytesIO) -> dict:
+    async def upload_image(
+        self,
+        file_path: str | bytes | BytesIO,
+        optimize: bool = False,
+        image_format: str = "webp",
+        quality: int = 80,
+        max_dimension: int | None = 2048,
+    ) -> dict:
         """Uploads an image to `Envs.sh <https://envs.sh>`_.
 
         Args:
@@ -1648,12 +2088,18 @@ class Client(UploadMedia):
                 - str: Local file path (e.g., "image.png").
                 - bytes: Raw binary data of the file.
                 - BytesIO: File-like object containing binary data.
+            optimize (bool, optional): Recompress the image with :meth:`optimize_image` before uploading (default: False).
+            image_format (str, optional): Output format used when ``optimize`` is True, one of "webp", "jpeg" or "png" (default: "webp").
+            quality (int, optional): Encoder quality used when ``optimize`` is True (default: 80).
+            max_dimension (int, optional): Maximum width or height used when ``optimize`` is True (default: 2048).
 
         Returns:
             dict: A dictionary containing the upload result:
                 - On success: {"success": true, "url": "<file_url>", "retention": "<days> days"}
                 - On failure: {"success": false, "error": "<error_message>"}
                 Retention period is calculated based on file size, ranging from 30 to 90 days.
+                When ``optimize`` is True, an "optimization" key reports the original size,
+                optimized size, bytes saved and the time spent.
 
         Examples:
 
@@ -1722,21 +2168,40 @@ class Client(UploadMedia):
         else:
             return {"success": False, "error": "Invalid input type"}
 
+        ext, mime_type = "png", "image/png"
+        report = None
+        if optimize:
+            report = await self.optimize_image(
+                image_bytes,
+                image_format=image_format,
+                quality=quality,
+                max_dimension=max_dimension,
+            )
+            if not report["success"]:
+                return report
+            image_bytes = report.pop("result")
+            report.pop("success")
+            ext = report["format"]
+            mime_type = f"image/{ext}"
+
         file_size = len(image_bytes)
         max_size, min_age, max_age = 512 * 1024 * 1024, 30, 90
         retention = min_age + (-max_age + min_age) * pow((file_size / max_size - 1), 3)
         retention = max(min_age, min(max_age, retention))
 
         url = "https://envs.sh"
-        files = {"file": ("upload.png", image_bytes, "image/png")}
+        files = {"file": (f"upload.{ext}", image_bytes, mime_type)}
 
         try:
             response = await self.request.post(url=url, files=files)
-            return {
+            result = {
                 "success": True,
                 "url": response.text.strip(),
                 "retention": f"{round(retention)} days",
             }
+            if optimize:
+                result["optimization"] = report
+            return result
         except Exception as e:
             return {"success": False, "error": str(e)}
 
@@ -1950,7 +2415,8 @@ class Client(UploadMedia):
         screen: str = "desktop",
         format: str = "jpeg",
         full: bool = False,
-    ) -> str:
+        output: str = "path",
+    ) -> str | bytes | BytesIO:
         """
         Generate a screenshot of a webpage using the given parameters.
 
@@ -1961,12 +2427,13 @@ class Client(UploadMedia):
                 or a custom resolution in the format "width×height". Defaults to "desktop".
             format (str, optional): The image format for the screenshot ("jpeg" or "png"). Defaults to "jpeg".
             full (bool, optional): Whether to capture the full page. Defaults to False.
+            output (str, optional): "path", "bytes" or "bytesio". Defaults to "path".
 
         Returns:
-            str: The filename of the saved screenshot.
+            str: The filename of the saved screenshot, or the image as ``bytes`` / ``BytesIO`` depending on ``output``.
 
         Raises:
-            ValueError: If the URL or screen resolution is invalid.
+            ValueError: If the URL, screen resolution or output is invalid.
 
         Screens:
             Predefined screen names and their resolutions:
@@ -2032,64 +2499,10 @@ class Client(UploadMedia):
            - If the website has ads, the chances of failure are high.
            - Use HD Quality only on small screen sizes.
         """
-
-        url_regex = re.compile(
-            r"^(https?:\/\/)?(([a-z\d]([a-z\d-]*[a-z\d])*)\.)+[a-z]{2,}(:\d+)?(\/[-a-z\d%_.~+]*)*(\?[;&a-z\d%_.~+=-]*)?(\#[-a-z\d_]*)?$",
-            re.IGNORECASE,
-        )
-        if not re.match(url_regex, url):
-            raise ValueError("Invalid URL provided.")
-        if not url.startswith(("http://", "https://")):
-            url = "https://" + url
-
-        screens = {
-            # common
-            "meta_thumbnail": (1200, 628),
-            "desktop": (1440, 1024),
-            "mackbook_pro": (1152, 700),
-            "surface_book": (1500, 1000),
-            "imac": (1280, 720),
-            "androvalue": (480, 1024),
-            "ipad": (414, 736),
-            "iphone": (480, 1024),
-            # Desktop and Laptop Resolutions
-            "24_desktop": (1920, 1200),
-            "23_desktop": (1920, 1080),
-            "22_desktop": (1680, 1050),
-            "20_desktop": (1600, 900),
-            "19_desktop": (1440, 900),
-            "15_notebook": (1366, 768),
-            "13_notebook": (1024, 800),
-            "10_notebook": (1024, 600),
-            # iPad/Tablets Resolutions
-            "ipad_pro": (1024, 1366),
-            "ipad_mini_air": (768, 1024),
-            "samsung_galaxy_10": (800, 1280),
-            "nexus_7": (600, 960),
-            "nexus_9": (768, 1024),
-            # Mobile Resolutions
-            "google_pixel": (411, 731),
-            "iphone_x": (375, 812),
-            "iphone_6_plus": (414, 736),
-            "iphone_7_8_6": (375, 667),
-            "iphone_5": (320, 568),
-            "iphone_4_3": (320, 480),
-            # Default
-            "desktop": (1440, 1024),
-        }
-
-        if "×" in screen:
-            try:
-                width, height = map(int, screen.split("×"))
-            except ValueError:
-                raise ValueError(
-                    "Invalid custom resolution format. Use 'width×height'."
-                )
-        else:
-            resolution = screens.get(screen)
-            if not resolution:
-                raise ValueError(f"Invalid screen value: {screen}")
-            width, height = resolution
+        if output not in OUTPUT_MODES:
+            return self._handle_error(self._output_error(output))
+        url = normalize_url(url)
+        width, height = screen_size(screen)
 
         payload = {
             "url": url,
@@ -2099,10 +2512,170 @@ class Client(UploadMedia):
             "full": full,
         }
 
-        response = await self.request.post(
-            "https://webscreenshot.vercel.app/api", json=payload
-        )
-        base64_string = response.json()["image"].split(",")[1]
-        base64_decoded = b64decode(base64_string)
-        path = await self._create_file(base64_decoded, ext=format, name="webshot")
-        return path
+        cached = await self._cache_get("take_screenshot", payload)
+        if cached is not None:
+            return await self._output(cached, ext=format, name="webshot", output=output)
+
+        # The image is decoded straight out of the response stream, so a full-page
+        # capture is never held as JSON text, base64 string and bytes at once.
+        async with self.request.stream(
+            "POST", "https://webscreenshot.vercel.app/api", json=payload
+        ) as response:
+            chunks = decode_base64_field(response.aiter_bytes(), "image")
+            if output == "path":
+                file_path = await self.downloads.write_chunks(
+                    chunks, ext=format, name="webshot"
+                )
+            else:
+                buffer = BytesIO()
+                async for chunk in chunks:
+                    buffer.write(chunk)
+
+        if output == "path":
+            if self.result_cache is not None:
+                await self.result_cache.set_file("take_screenshot", payload, file_path)
+            return file_path
+        if output == "bytes":
+            contents = buffer.getvalue()
+            await self._cache_set("take_screenshot", payload, contents)
+            return contents
+        if self.result_cache is not None:
+            await self.result_cache.set("take_screenshot", payload, buffer.getvalue())
+        buffer.seek(0)
+        buffer.name = f"webshot.{format}"
+        return buffer
+
+    async def take_screenshots(
+        self,
+        urls: list[str],
+        screens: list[str] | tuple[str, ...] = ("desktop",),
+        format: str = "jpeg",
+        full: bool = False,
+        output: str = "path",
+        concurrency: int = 4,
+        ttl: float | None = 300,
+    ) -> AsyncIterator[dict]:
+        """
+        Captures every combination of ``urls`` and ``screens``, yielding results as they finish.
+
+        URLs are normalized (default scheme, case, default port) and duplicate URL and
+        resolution pairs are captured once, with one result yielded for each requested screen. At most ``concurrency`` captures run at a time.
+        With ``output="path"``, a file captured by an earlier call within ``ttl`` seconds is
+        reused; other outputs are reused through the client's ``result_cache``.
+
+        Args:
+            urls (``list``): The URLs to capture.
+            screens (``list``, *optional*): Screen presets or ``"width×height"`` sizes, as accepted by
+                :meth:`take_screenshot`. Defaults to ``("desktop",)``.
+            format (``str``, *optional*): The image format, ``"jpeg"`` or ``"png"``. Defaults to ``"jpeg"``.
+            full (``bool``, *optional*): Whether to capture the full page. Defaults to False.
+            output (``str``, *optional*): ``"path"``, ``"bytes"`` or ``"bytesio"``. Defaults to ``"path"``.
+            concurrency (``int``, *optional*): Maximum number of captures in flight. Defaults to 4.
+            ttl (``float``, *optional*): Seconds a captured file is reused for. ``None`` reuses it for as
+                long as it exists and ``0`` disables reuse. Defaults to 300. At most the 1024 most
+                recent captures are remembered for reuse.
+
+        Yields:
+            ``dict``: ``url`` (normalized), ``screen``, ``result`` (as returned by :meth:`take_screenshot`,
+            or ``None`` on failure) and ``error`` (the error message, or ``None``).
+
+        Raises:
+            ValueError: If a screen or ``output`` is invalid. With a ``quiet`` client, an invalid
+                ``output`` yields a single error dict instead.
+
+        Example:
+            .. code-block:: python
+
+               async for shot in api.take_screenshots(
+                   ["github.com", "https://python.org"],
+                   screens=["meta_thumbnail", "iphone_x"],
+               ):
+                   print(shot["url"], shot["screen"], shot["result"] or shot["error"])
+        """
+        if output not in OUTPUT_MODES:
+            yield self._handle_error(self._output_error(output))
+            return
+        for screen in screens:
+            screen_size(screen)
+
+        jobs, failed = {}, []
+        for url in urls:
+            try:
+                url = normalize_url(url)
+            except ValueError as e:
+                failed.extend(
+                    {"url": url, "screen": screen, "result": None, "error": str(e)}
+                    for screen in screens
+                )
+                continue
+            for screen in screens:
+                _, names = jobs.setdefault(
+                    (url, screen_size(screen), format, full), (url, [])
+                )
+                if screen not in names:
+                    names.append(screen)
+
+        for item in failed:
+            yield item
+
+        if ttl is not None:
+            deadline = time.time() - ttl
+            for key in [
+                key for key, entry in self._screenshots.items() if entry[0] < deadline
+            ]:
+                del self._screenshots[key]
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def capture(key: tuple, url: str, screens: list[str]) -> list[dict]:
+            cache_key = ResultCache.key("take_screenshot", key)
+            recent = self._screenshots.get(cache_key)
+            result = error = None
+            if (
+                output == "path"
+                and recent
+                and (ttl is None or time.time() - recent[0] < ttl)
+                and os.path.isfile(recent[1])
+            ):
+                self._screenshots.move_to_end(cache_key)
+                self.downloads.touch(recent[1])
+                result = recent[1]
+            else:
+                async with semaphore:
+                    try:
+                        result = await self.take_screenshot(
+                            url,
+                            screen=screens[0],
+                            format=format,
+                            full=full,
+                            output=output,
+                        )
+                    except Exception as e:
+                        error = str(e)
+                if output == "path" and ttl != 0 and error is None:
+                    self._screenshots[cache_key] = (time.time(), result)
+                    self._screenshots.move_to_end(cache_key)
+                    while len(self._screenshots) > SCREENSHOT_REUSE_SIZE:
+                        self._screenshots.popitem(last=False)
+            items = []
+            for screen in screens:
+                if isinstance(result, BytesIO) and items:
+                    # Every entry gets its own buffer to read from.
+                    copy = BytesIO(result.getvalue())
+                    copy.name = result.name
+                    result = copy
+                items.append(
+                    {"url": url, "screen": screen, "result": result, "error": error}
+                )
+            return items
+
+        tasks = [
+            asyncio.ensure_future(capture(key, url, screens))
+            for key, (url, screens) in jobs.items()
+        ]
+        try:
+            for task in asyncio.as_completed(tasks):
+                for item in await task:
+                    yield item
+        finally:
+            for task in tasks:
+                task.cancel()
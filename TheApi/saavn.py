@@ -1,4 +1,15 @@
+import asyncio
+from collections import deque
+from typing import AsyncIterator, Awaitable, Callable
+
 from ._request import Request
+from ._saavn_store import SaavnStore
+
+# Song IDs sent per request to the /api/songs?ids= endpoint.
+SONG_IDS_PER_REQUEST = 50
+
+# Songs requested per page by iter_playlist_songs.
+PLAYLIST_PAGE_SIZE = 50
 
 
 class SaavnAPI:
@@ -6,15 +17,89 @@ class SaavnAPI:
     A class for interacting with the Saavn API.
 
     This class provides methods for searching songs, albums, artists, and playlists
-    globally on the Saavn platform.
+    globally on the Saavn platform. Responses are plain dicts; :class:`Song`, :class:`Album`,
+    :class:`Artist` and :class:`Playlist` turn them into compact models with ``parse``.
+
+    Args:
+        store (``SaavnStore``, *optional*): A persistent entity store. Songs, albums, artists and
+            lyrics found in it are returned without a request, and every response is added to it.
     """
 
-    def __init__(self):
+    def __init__(self, store: SaavnStore | None = None):
         """
         Initializes the SaavnAPI instance with the base URL for the Saavn API.
         """
         self.base_url = "https://saavn.dev"
         self.req = Request()
+        self.store = store
+
+    async def _get(self, url: str, params: dict | None = None) -> dict:
+        response = (await self.req.get(url, params=params)).json()
+        if self.store is not None and response.get("success"):
+            await self.store.harvest(response.get("data"))
+        return response
+
+    @staticmethod
+    async def _iter_pages(
+        fetch: Callable[[int], Awaitable[dict]],
+        items_key: str,
+        total_key: str,
+        concurrency: int,
+    ) -> AsyncIterator[dict]:
+        """
+        Yields the ``items_key`` items of every page in order.
+
+        The first page gives the ``total_key`` item count and the page size. The remaining pages
+        are fetched in a window of at most ``concurrency`` pages ahead of the one being yielded.
+        """
+
+        async def page_items(page: int) -> list[dict]:
+            response = await fetch(page)
+            if not response.get("success"):
+                raise ValueError(f"Saavn API error: {response.get('message')}")
+            return response["data"].get(items_key) or []
+
+        first = await fetch(0)
+        if not first.get("success"):
+            raise ValueError(f"Saavn API error: {first.get('message')}")
+        items = first["data"].get(items_key) or []
+        for item in items:
+            yield item
+        total = first["data"].get(total_key) or 0
+        if not items or len(items) >= total:
+            return
+
+        pages = iter(range(1, -(-total // len(items))))
+        window = deque()
+        try:
+            for page in pages:
+                window.append(asyncio.ensure_future(page_items(page)))
+                if len(window) >= concurrency:
+                    break
+            while window:
+                items = await window.popleft()
+                if not items:
+                    return
+                page = next(pages, None)
+                if page is not None:
+                    window.append(asyncio.ensure_future(page_items(page)))
+                for item in items:
+                    yield item
+        finally:
+            for task in window:
+                task.cancel()
+
+    @staticmethod
+    async def collect(items: AsyncIterator) -> list:
+        """
+        Collects everything an async iterator such as :meth:`iter_playlist_songs` yields.
+
+        Example:
+            .. code-block:: python
+
+               songs = await api.collect(api.iter_artist_songs("459320"))
+        """
+        return [item async for item in items]
 
     async def search(self, query: str):
         """
@@ -40,8 +125,7 @@ class SaavnAPI:
                print(response)
         """
         url = f"{self.base_url}/api/search"
-        r = await self.req.get(url, params={"query": query})
-        return r.json()
+        return await self._get(url, params={"query": query})
 
     async def search_songs(self, query: str, page: int = 0, limit: int = 10):
         """
@@ -56,10 +140,9 @@ class SaavnAPI:
             dict: The search results for songs.
         """
         url = f"{self.base_url}/api/search/songs"
-        r = await self.req.get(
+        return await self._get(
             url, params={"query": query, "page": page, "limit": limit}
         )
-        return r.json()
 
     async def search_albums(self, query: str, page: int = 0, limit: int = 10):
         """
@@ -74,10 +157,9 @@ class SaavnAPI:
             dict: The search results for albums.
         """
         url = f"{self.base_url}/api/search/albums"
-        r = await self.req.get(
+        return await self._get(
             url, params={"query": query, "page": page, "limit": limit}
         )
-        return r.json()
 
     async def search_artists(self, query: str, page: int = 0, limit: int = 10):
         """
@@ -92,10 +174,9 @@ class SaavnAPI:
             dict: The search results for artists.
         """
         url = f"{self.base_url}/api/search/artists"
-        r = await self.req.get(
+        return await self._get(
             url, params={"query": query, "page": page, "limit": limit}
         )
-        return r.json()
 
     async def search_playlists(self, query: str, page: int = 0, limit: int = 10):
         """
@@ -110,10 +191,9 @@ class SaavnAPI:
             dict: The search results for playlists.
         """
         url = f"{self.base_url}/api/search/playlists"
-        r = await self.req.get(
+        return await self._get(
             url, params={"query": query, "page": page, "limit": limit}
         )
-        return r.json()
 
     async def get_song_by_id(self, song_id: str):
         """
@@ -125,9 +205,68 @@ class SaavnAPI:
         Returns:
             dict: The song details.
         """
+        if self.store is not None:
+            song = await self.store.get("song", song_id)
+            if song is not None:
+                return {"success": True, "data": [song]}
         url = f"{self.base_url}/api/songs/{song_id}"
-        r = await self.req.get(url)
-        return r.json()
+        return await self._get(url)
+
+    async def get_songs_by_ids(
+        self,
+        song_ids: list[str],
+        chunk_size: int = SONG_IDS_PER_REQUEST,
+        concurrency: int = 4,
+    ):
+        """
+        Retrieves many songs by their IDs in as few requests as possible.
+
+        The IDs are deduplicated and split into chunks of ``chunk_size``, which are fetched
+        concurrently with at most ``concurrency`` requests in flight. Songs found in the
+        :attr:`store` are not requested.
+
+        Args:
+            song_ids (list[str]): The IDs of the songs.
+            chunk_size (int, optional): The number of IDs sent per request. Defaults to 50.
+            concurrency (int, optional): The maximum number of requests in flight. Defaults to 4.
+
+        Returns:
+            dict: ``success`` (False only if none of the songs were found), ``data`` with one song
+            per input ID in input order (``None`` for IDs that were not found) and ``missing``
+            with the IDs that were not found.
+
+        Example:
+            .. code-block:: python
+
+               response = await api.get_songs_by_ids(["3IoDK8qI", "K1P6vDt3", "nope"])
+
+               print(response["missing"])
+        """
+        url = f"{self.base_url}/api/songs"
+        unique = list(dict.fromkeys(song_ids))
+        songs = {}
+        if self.store is not None:
+            songs = await self.store.get_many("song", unique)
+        remaining = [song_id for song_id in unique if song_id not in songs]
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(chunk: list[str]) -> list[dict]:
+            async with semaphore:
+                response = await self._get(url, params={"ids": ",".join(chunk)})
+            if not response.get("success"):
+                return []
+            return response.get("data") or []
+
+        chunks = await asyncio.gather(
+            *(
+                fetch(remaining[i : i + chunk_size])
+                for i in range(0, len(remaining), chunk_size)
+            )
+        )
+        songs.update((song["id"], song) for chunk in chunks for song in chunk)
+        data = [songs.get(song_id) for song_id in song_ids]
+        missing = [song_id for song_id in unique if song_id not in songs]
+        return {"success": bool(songs) or not unique, "data": data, "missing": missing}
 
     async def get_song_lyrics(self, song_id: str):
         """
@@ -139,9 +278,15 @@ class SaavnAPI:
         Returns:
             dict: The song lyrics.
         """
+        if self.store is not None:
+            lyrics = await self.store.get("lyrics", song_id)
+            if lyrics is not None:
+                return {"success": True, "data": lyrics}
         url = f"{self.base_url}/api/songs/{song_id}/lyrics"
-        r = await self.req.get(url)
-        return r.json()
+        response = await self._get(url)
+        if self.store is not None and response.get("success"):
+            await self.store.put("lyrics", song_id, response.get("data"))
+        return response
 
     async def get_song_suggestions(self, song_id: str, limit: int = 10):
         """
@@ -155,8 +300,7 @@ class SaavnAPI:
             dict: The song suggestions.
         """
         url = f"{self.base_url}/api/songs/{song_id}/suggestions"
-        r = await self.req.get(url, params={"limit": limit})
-        return r.json()
+        return await self._get(url, params={"limit": limit})
 
     async def get_album(self, album_id: str = None, album_link: str = None):
         """
@@ -169,14 +313,25 @@ class SaavnAPI:
         Returns:
             dict: The album details.
         """
+        if self.store is not None:
+            if album_id:
+                album = await self.store.get("album", album_id)
+            else:
+                album = await self.store.get_by_link("album", album_link)
+            if album is not None:
+                return {"success": True, "data": album}
         url = f"{self.base_url}/api/albums"
         params = {}
         if album_id:
             params["id"] = album_id
         if album_link:
             params["link"] = album_link
-        r = await self.req.get(url, params=params)
-        return r.json()
+        response = await self._get(url, params=params)
+        album = response.get("data")
+        if self.store is not None and album_link and response.get("success"):
+            # Index the link as given, which need not match the album's canonical url.
+            await self.store.put("album", album["id"], album, link=album_link)
+        return response
 
     async def get_playlist(
         self,
@@ -203,8 +358,45 @@ class SaavnAPI:
             params["id"] = playlist_id
         if playlist_link:
             params["link"] = playlist_link
-        r = await self.req.get(url, params=params)
-        return r.json()
+        return await self._get(url, params=params)
+
+    async def iter_playlist_songs(
+        self,
+        playlist_id: str = None,
+        playlist_link: str = None,
+        page_size: int = PLAYLIST_PAGE_SIZE,
+        concurrency: int = 4,
+    ) -> AsyncIterator[dict]:
+        """
+        Yields every song of a playlist in order.
+
+        The first page gives the playlist's song count; the remaining pages are fetched
+        concurrently, at most ``concurrency`` pages ahead of the songs being yielded.
+
+        Args:
+            playlist_id (str, optional): The ID of the playlist.
+            playlist_link (str, optional): The link to the playlist.
+            page_size (int, optional): The number of songs requested per page. Defaults to 50.
+            concurrency (int, optional): The maximum number of pages in flight. Defaults to 4.
+
+        Yields:
+            dict: One song per item.
+
+        Raises:
+            ValueError: If the API returns an error.
+
+        Example:
+            .. code-block:: python
+
+               async for song in api.iter_playlist_songs(playlist_id="110858205"):
+                   print(song["name"])
+        """
+
+        def fetch(page: int) -> Awaitable[dict]:
+            return self.get_playlist(playlist_id, playlist_link, page, page_size)
+
+        async for song in self._iter_pages(fetch, "songs", "songCount", concurrency):
+            yield song
 
     async def get_artist(
         self,
@@ -229,6 +421,18 @@ class SaavnAPI:
         Returns:
             dict: The artist details.
         """
+        # The stored artist carries the default page of songs and albums.
+        stored = self.store is not None and (
+            page,
+            song_count,
+            album_count,
+            sort_by,
+            sort_order,
+        ) == (0, 10, 10, "popularity", "desc")
+        if stored:
+            artist = await self.store.get("artist", artist_id)
+            if artist is not None:
+                return {"success": True, "data": artist}
         url = f"{self.base_url}/api/artists/{artist_id}"
         params = {
             "page": page,
@@ -237,8 +441,11 @@ class SaavnAPI:
             "sortBy": sort_by,
             "sortOrder": sort_order,
         }
-        r = await self.req.get(url, params=params)
-        return r.json()
+        response = await self._get(url, params=params)
+        if stored and response.get("success"):
+            artist = response.get("data")
+            await self.store.put("artist", artist_id, artist, link=artist.get("url"))
+        return response
 
     async def get_artist_albums(
         self,
@@ -261,8 +468,7 @@ class SaavnAPI:
         """
         url = f"{self.base_url}/api/artists/{artist_id}/albums"
         params = {"page": page, "sortBy": sort_by, "sortOrder": sort_order}
-        r = await self.req.get(url, params=params)
-        return r.json()
+        return await self._get(url, params=params)
 
     async def get_artist_songs(
         self,
@@ -285,5 +491,62 @@ class SaavnAPI:
         """
         url = f"{self.base_url}/api/artists/{artist_id}/songs"
         params = {"page": page, "sortBy": sort_by, "sortOrder": sort_order}
-        r = await self.req.get(url, params=params)
-        return r.json()
+        return await self._get(url, params=params)
+
+    async def iter_artist_songs(
+        self,
+        artist_id: str,
+        sort_by: str = "popularity",
+        sort_order: str = "desc",
+        concurrency: int = 4,
+    ) -> AsyncIterator[dict]:
+        """
+        Yields every song of an artist in order, paging like :meth:`iter_playlist_songs`.
+
+        Args:
+            artist_id (str): The ID of the artist.
+            sort_by (str, optional): The sorting criteria. Defaults to "popularity".
+            sort_order (str, optional): The sorting order. Defaults to "desc".
+            concurrency (int, optional): The maximum number of pages in flight. Defaults to 4.
+
+        Yields:
+            dict: One song per item.
+
+        Raises:
+            ValueError: If the API returns an error.
+        """
+
+        def fetch(page: int) -> Awaitable[dict]:
+            return self.get_artist_songs(artist_id, page, sort_by, sort_order)
+
+        async for song in self._iter_pages(fetch, "songs", "total", concurrency):
+            yield song
+
+    async def iter_artist_albums(
+        self,
+        artist_id: str,
+        sort_by: str = "popularity",
+        sort_order: str = "desc",
+        concurrency: int = 4,
+    ) -> AsyncIterator[dict]:
+        """
+        Yields every album of an artist in order, paging like :meth:`iter_playlist_songs`.
+
+        Args:
+            artist_id (str): The ID of the artist.
+            sort_by (str, optional): The sorting criteria. Defaults to "popularity".
+            sort_order (str, optional): The sorting order. Defaults to "desc".
+            concurrency (int, optional): The maximum number of pages in flight. Defaults to 4.
+
+        Yields:
+            dict: One album per item.
+
+        Raises:
+            ValueError: If the API returns an error.
+        """
+
+        def fetch(page: int) -> Awaitable[dict]:
+            return self.get_artist_albums(artist_id, page, sort_by, sort_order)
+
+        async for album in self._iter_pages(fetch, "albums", "total", concurrency):
+            yield album
@@ -0,0 +1,91 @@
+import random
+import re
+import string
+import time
+
+import pytest
+
+from TheApi import _qr
+
+random.seed(0)
+URLS = [
+    "https://example.com/"
+    + "".join(random.choices(string.ascii_letters, k=random.randint(5, 40)))
+    for _ in range(1000)
+]
+
+
+def _reference_penalty(modules) -> int:
+    # The penalty rules read straight off the module strings.
+    rows = ["".join("1" if m else "0" for m in row) for row in modules]
+    cols = ["".join(col) for col in zip(*rows)]
+    score = 0
+    for line in rows + cols:
+        for run in re.finditer(r"0{5,}|1{5,}", line):
+            score += run.end() - run.start() - 2
+        score += 40 * (line.count("10111010000") + line.count("00001011101"))
+    for upper, lower in zip(rows, rows[1:]):
+        for x in range(len(upper) - 1):
+            if upper[x] == upper[x + 1] == lower[x] == lower[x + 1]:
+                score += 3
+    dark, total = sum(row.count("1") for row in rows), len(rows) ** 2
+    return score + ((abs(dark * 20 - total * 10) + total - 1) // total - 1) * 10
+
+
+@pytest.mark.parametrize("version", [1, 2, 7, 21])
+def test_penalty_matches_reference(version):
+    layout = _qr._layout(version)
+    size, stride = layout.size, layout.stride
+    bits = bytes(random.choice(b"01") for _ in range(_qr._raw_data_modules(version)))
+    rows = int(bytes(layout.rows(bits[: len(bits) // 8 * 8] + b"01")), 2)
+    cols = int(bytes(layout.cols(bits[: len(bits) // 8 * 8] + b"01")), 2)
+
+    for mask, (mask_rows, mask_cols) in enumerate(layout.masks):
+        format_rows, format_cols = _qr._format_patch(version, 1, mask)
+        masked = rows ^ mask_rows | format_rows
+        packed = format(masked, f"0{size * stride}b")
+        modules = [
+            [m == "1" for m in packed[y * stride : y * stride + size]]
+            for y in range(size)
+        ]
+
+        assert _qr._penalty(
+            masked, cols ^ mask_cols | format_cols, layout
+        ) == _reference_penalty(modules)
+
+
+@pytest.mark.parametrize("error_correction", ["L", "M", "Q", "H"])
+def test_encode_matches_qrcode_symbol(error_correction):
+    qrcode = pytest.importorskip("qrcode")
+    from qrcode.util import MODE_8BIT_BYTE, QRData
+
+    levels = {"L": 1, "M": 0, "Q": 3, "H": 2}
+    for data in URLS[:20]:
+        modules = [list(row) for row in _qr.encode(data, error_correction)]
+        version = (len(modules) - 17) // 4
+        symbols = []
+        for mask in range(8):
+            qr = qrcode.QRCode(
+                version=version,
+                error_correction=levels[error_correction],
+                mask_pattern=mask,
+                border=0,
+            )
+            qr.add_data(QRData(data.encode(), mode=MODE_8BIT_BYTE))
+            qr.make(fit=False)
+            symbols.append(qr.get_matrix())
+
+        assert modules in symbols
+
+
+def test_encode_throughput():
+    # Uncached encodes of short URLs; the layouts per version are warmed up first.
+    for data in URLS[:50]:
+        _qr.encode.__wrapped__(data)
+
+    start = time.perf_counter()
+    for data in URLS:
+        _qr.encode.__wrapped__(data)
+    rate = len(URLS) / (time.perf_counter() - start)
+
+    assert rate >= 1000, f"{rate:.0f} codes/s"
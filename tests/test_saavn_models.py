@@ -0,0 +1,101 @@
+from TheApi import Album, Artist, Song
+
+
+def _song(song_id: str) -> dict:
+    return {
+        "id": song_id,
+        "name": f"Song {song_id}",
+        "type": "song",
+        "duration": 215,
+        "album": {
+            "id": "al1",
+            "name": "Album",
+            "url": "https://www.jiosaavn.com/album/x/al1",
+        },
+        "artists": {
+            "primary": [
+                {"id": "ar1", "name": "Artist", "role": "music", "type": "artist"}
+            ],
+            "featured": [],
+        },
+        "image": [
+            {"quality": "500x500", "url": "https://c.saavncdn.com/x-500x500.jpg"}
+        ],
+        "downloadUrl": [
+            {"quality": "320kbps", "url": "https://aac.saavncdn.com/x_320.mp4"}
+        ],
+    }
+
+
+def test_parse_artist_songs():
+    # Shape of SaavnAPI.get_artist_songs.
+    response = {
+        "success": True,
+        "data": {"total": 2, "songs": [_song("s1"), _song("s2")]},
+    }
+
+    songs = Song.parse(response)
+
+    assert [song.id for song in songs] == ["s1", "s2"]
+    assert songs[0].album.id == "al1"
+    assert songs[0].artists[0].name == "Artist"
+    assert songs[0].download_urls[-1].quality == "320kbps"
+
+
+def test_parse_artist_albums():
+    # Shape of SaavnAPI.get_artist_albums.
+    albums = [
+        {"id": "al1", "name": "First", "type": "album", "image": []},
+        {"id": "al2", "name": "Second", "type": "album", "image": []},
+    ]
+    response = {"success": True, "data": {"total": 2, "albums": albums}}
+
+    parsed = Album.parse(response)
+
+    assert [album.id for album in parsed] == ["al1", "al2"]
+    assert parsed[1].name == "Second"
+
+
+def test_parse_single_album_keeps_songs_lazy():
+    response = {
+        "success": True,
+        "data": {"id": "al1", "name": "Album", "type": "album", "songs": [_song("s1")]},
+    }
+
+    album = Album.parse(response)
+
+    assert album._songs[0]["id"] == "s1"
+    assert album.songs[0].id == "s1"
+    assert isinstance(album._songs, tuple)
+
+
+def test_parse_projection_and_failure():
+    response = {"success": True, "data": {"results": [_song("s1")]}}
+
+    (song,) = Song.parse(response, fields=["id", "download_urls"])
+
+    assert song.id == "s1"
+    assert song.name is None and song.images is None
+    assert Song.parse({"success": False, "message": "not found"}) is None
+
+
+def test_parse_global_search():
+    # Shape of SaavnAPI.search: one nested result list per entity type.
+    response = {
+        "success": True,
+        "data": {
+            "topQuery": {"results": [], "position": 0},
+            "songs": {"results": [_song("s1"), _song("s2")], "position": 1},
+            "albums": {"results": [{"id": "al1", "name": "Album"}], "position": 2},
+        },
+    }
+
+    assert [song.id for song in Song.parse(response)] == ["s1", "s2"]
+    assert [album.id for album in Album.parse(response)] == ["al1"]
+    assert Artist.parse(response) is None
+
+
+def test_parse_unrecognised_shape():
+    assert Song.parse({"success": True, "data": {"total": 0}}) is None
+    assert Song.parse({"success": True, "data": {"songs": {"total": 0}}}) is None
+    assert Song.parse({"success": True, "data": None}) is None